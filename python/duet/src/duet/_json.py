@@ -0,0 +1,49 @@
+"""JSON helpers that use orjson when available and fall back to the stdlib."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:  # Optional accelerated codec (installed via the ``fast`` extra)
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(payload: Union[str, bytes, bytearray]) -> Any:
+    """Parse a JSON document from text or UTF-8 bytes."""
+
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize ``value`` to compact UTF-8 encoded JSON."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson rejects some inputs the stdlib accepts (e.g. integers wider
+            # than 64 bits or non-string keys); defer to json for those.
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(value: Any) -> str:
+    """Serialize ``value`` to a compact JSON string."""
+
+    return dumps_bytes(value).decode("utf-8")
+
+
+def dumps_pretty(value: Any) -> str:
+    """Serialize ``value`` to JSON indented by two spaces."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, indent=2)
@@ -2,36 +2,44 @@
 
 from __future__ import annotations
 
-import asyncio
+import atexit
 import contextlib
-import json
+import errno
+import functools
+import importlib.util
 import os
+import random
 import re
+import select
+import selectors
 import signal
 import socket
 import subprocess
 import shutil
-from collections import Counter
+import sys
+from collections import Counter, deque
 import time
-import traceback
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple, NoReturn
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple, NoReturn, Union
 
 import rich_click as click  # Must be imported before typer to patch Click
 import typer
 from rich import box
 from rich.console import Console, Group
-from rich.live import Live
+from rich.highlighter import JSONHighlighter
 from rich.json import JSON
 from rich.panel import Panel
-from rich.markdown import Markdown
 from rich.table import Table
-from rich.tree import Tree
 from rich.text import Text
 
-from .protocol.client import ControlClient, ProtocolError
+
+from . import _json
+from .protocol.client import PROTOCOL_VERSION, ControlClient, ProtocolError
+
+if TYPE_CHECKING:
+    import asyncio
 
 # Configure rich-click aesthetics
 click.rich_click.USE_RICH_MARKUP = True
@@ -44,6 +52,13 @@ click.rich_click.MAX_WIDTH = 100
 
 console = Console()
 
+# When set, results are written as one JSON document per line and errors as
+# single lines on stderr, bypassing Rich rendering entirely. Anything else
+# the console prints (notices, prompts) is sent to stderr as well. Computed
+# per invocation from --plain/--no-plain; ``duet-plain`` sets _PLAIN_FORCED.
+_PLAIN_OUTPUT = False
+_PLAIN_FORCED = False
+
 STOPWORDS = {
     "the", "and", "that", "this", "with", "from", "your", "you", "have", "into", "about",
     "than", "then", "there", "their", "what", "when", "where", "which", "would",
@@ -121,16 +136,21 @@ DEFAULT_ROOT_NAME = ".duet"
 DEFAULT_DAEMON_HOST = '127.0.0.1'
 DAEMON_STATE_FILE = 'daemon.json'
 DAEMON_LOG_FILE = 'daemon.log'
+TAIL_BACKOFF_MULTIPLIER = 1.5
+TAIL_BACKOFF_MAX = 5.0
+TAIL_BACKOFF_JITTER = 0.1
+HISTORY_PAGE_TURNS = 200
+RESUME_PROMPT_BUDGET = 16000
 
 
-@dataclass
-class DaemonState:
+class DaemonState(NamedTuple):
+    # Immutable: instances are shared through the _parse_daemon_state cache.
     pid: int
     host: str
     port: int
     root: Path
-
-
+    # Kernel start time of ``pid`` (Linux only); detects PID reuse.
+    started: Optional[int] = None
 
 
 def _resolve_root_path(root: Optional[Path]) -> Path:
@@ -147,8 +167,7 @@ def _resolve_root_path(root: Optional[Path]) -> Path:
     return (cwd / DEFAULT_ROOT_NAME).resolve()
 
 
-def _ensure_root_dir(root: Optional[Path]) -> Path:
-    path = _resolve_root_path(root)
+def _ensure_root_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
@@ -157,23 +176,40 @@ def _daemon_state_path(root: Path) -> Path:
     return root / DAEMON_STATE_FILE
 
 
-def _load_daemon_state(root: Path) -> Optional[DaemonState]:
-    state_path = _daemon_state_path(root)
-    if not state_path.exists():
-        return None
+# Addresses of local daemons already verified in this process, keyed by root,
+# so repeated connections skip re-reading the state file and re-probing.
+_DAEMON_ADDR_CACHE: Dict[Path, Tuple[str, int]] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_daemon_state(root: Path, mtime_ns: int, size: int) -> Optional[DaemonState]:
+    """Parse the state file for ``root``; keyed on its stat so edits invalidate."""
+
     try:
-        data = json.loads(state_path.read_text())
-        state = DaemonState(
+        data = _json.loads(_daemon_state_path(root).read_bytes())
+        return DaemonState(
             pid=int(data["pid"]),
             host=data.get("host", DEFAULT_DAEMON_HOST),
             port=int(data["port"]),
             root=root,
+            started=data.get("started"),
         )
     except Exception:
+        return None
+
+
+def _load_daemon_state(root: Path) -> Optional[DaemonState]:
+    state_path = _daemon_state_path(root)
+    try:
+        stat = state_path.stat()
+    except OSError:
+        return None
+    state = _parse_daemon_state(root, stat.st_mtime_ns, stat.st_size)
+    if state is None:
         with contextlib.suppress(OSError):
             state_path.unlink()
         return None
-    if not _is_process_alive(state.pid):
+    if not _is_process_alive(state.pid) or not _is_daemon_process(state):
         with contextlib.suppress(OSError):
             state_path.unlink()
         return None
@@ -182,11 +218,22 @@ def _load_daemon_state(root: Path) -> Optional[DaemonState]:
 
 def _save_daemon_state(state: DaemonState) -> None:
     state_path = _daemon_state_path(state.root)
-    payload = {"pid": state.pid, "host": state.host, "port": state.port}
-    state_path.write_text(json.dumps(payload))
+    payload: Dict[str, Any] = {"pid": state.pid, "host": state.host, "port": state.port}
+    if state.started is not None:
+        payload["started"] = state.started
+    state_path.write_bytes(_json.dumps_bytes(payload))
+    _forget_daemon_state(state.root)
+
+
+def _forget_daemon_state(root: Path) -> None:
+    # Filesystems with coarse timestamps can leave a rewritten state file
+    # with the same mtime and size, so drop cached parses explicitly.
+    _DAEMON_ADDR_CACHE.pop(root, None)
+    _parse_daemon_state.cache_clear()
 
 
 def _clear_daemon_state(root: Path) -> None:
+    _forget_daemon_state(root)
     state_path = _daemon_state_path(root)
     with contextlib.suppress(OSError):
         state_path.unlink()
@@ -199,19 +246,23 @@ def _stop_daemon_if_running(root: Path, *, quiet: bool = False) -> bool:
             console.print("[yellow]Daemon is not running.[/yellow]")
         return False
 
-    if _is_process_alive(state.pid):
-        try:
-            os.kill(state.pid, signal.SIGTERM)
-        except ProcessLookupError:
-            pass
-        else:
-            for _ in range(50):
-                if not _is_process_alive(state.pid):
-                    break
-                time.sleep(0.1)
+    # Pin the process with a pidfd before re-checking its identity so the
+    # signals below cannot reach an unrelated process that reused the PID.
+    pidfd = _open_pidfd(state.pid)
+    try:
+        if _is_process_alive(state.pid) and _is_daemon_process(state):
+            try:
+                _send_signal(state.pid, signal.SIGTERM, pidfd)
+            except ProcessLookupError:
+                pass
             else:
-                with contextlib.suppress(ProcessLookupError):
-                    os.kill(state.pid, signal.SIGKILL)
+                if not _wait_for_exit(state.pid, 5.0, pidfd=pidfd):
+                    with contextlib.suppress(ProcessLookupError):
+                        _send_signal(state.pid, signal.SIGKILL, pidfd)
+                    _wait_for_exit(state.pid, 1.0, pidfd=pidfd)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
 
     _clear_daemon_state(root)
     if not quiet:
@@ -219,21 +270,158 @@ def _stop_daemon_if_running(root: Path, *, quiet: bool = False) -> bool:
     return True
 
 
+def _send_signal(pid: int, sig: int, pidfd: Optional[int] = None) -> None:
+    if pidfd is not None:
+        signal.pidfd_send_signal(pidfd, sig)
+    else:
+        os.kill(pid, sig)
+
+
+def _process_start_time(pid: int) -> Optional[int]:
+    """Return the kernel start time of ``pid`` in clock ticks, if known."""
+
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as handle:
+            stat = handle.read()
+    except OSError:
+        return None
+    # The command name may contain spaces or parentheses, so split after the
+    # last ')'; starttime is field 22 overall, the 20th field after it.
+    fields = stat[stat.rfind(b")") + 2 :].split()
+    try:
+        return int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+def _is_daemon_process(state: DaemonState) -> bool:
+    """Check that ``state.pid`` still names the process that was recorded."""
+
+    if state.started is None:
+        return True
+    started = _process_start_time(state.pid)
+    return started is None or started == state.started
+
+
+def _wait_for_exit(pid: int, timeout: float, *, pidfd: Optional[int] = None) -> bool:
+    """Wait up to ``timeout`` seconds for ``pid`` to exit; return whether it did.
+
+    Uses a pidfd (Linux) or a kqueue process filter (BSD/macOS) so the wait
+    wakes as soon as the process exits, polling only as a last resort. A
+    caller-supplied ``pidfd`` is used as-is and left open.
+    """
+
+    owned = pidfd is None
+    if owned:
+        pidfd = _open_pidfd(pid)
+    if pidfd is not None:
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            return bool(poller.poll(int(timeout * 1000)))
+        finally:
+            if owned:
+                os.close(pidfd)
+
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT,
+            )
+            try:
+                return bool(kq.control([event], 1, timeout))
+            except ProcessLookupError:
+                return True
+        finally:
+            kq.close()
+
+    deadline = time.monotonic() + timeout
+    while _is_process_alive(pid):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.1)
+    return True
+
+
+# On Linux a /proc lookup answers liveness without going through the signal
+# path, and is not fooled by EPERM when the daemon runs as another user.
+_HAS_PROCFS = sys.platform.startswith("linux") and os.path.isdir("/proc/self")
+
+
 def _is_process_alive(pid: int) -> bool:
+    if _HAS_PROCFS:
+        try:
+            os.stat(f"/proc/{pid}")
+        except FileNotFoundError:
+            return False
+        except PermissionError:
+            return True
+        return True
     try:
         os.kill(pid, 0)
+    except PermissionError:
+        return True
     except OSError:
         return False
     else:
         return True
 
 
+@functools.lru_cache(maxsize=8)
+def _ip_literal_family(host: str) -> Optional[int]:
+    """Return the address family if ``host`` is a numeric IP, else ``None``."""
+
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, host)
+        except (OSError, ValueError):
+            continue
+        return family
+    return None
+
+
 def _ping_daemon(host: str, port: int, timeout: float = 0.2) -> bool:
+    family = _ip_literal_family(host)
+    if family is None:
+        try:
+            with socket.create_connection((host, port), timeout):
+                return True
+        except OSError:
+            return False
+
+    # Numeric hosts (the usual 127.0.0.1) need no getaddrinfo round trip.
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            return sock.connect_ex((host, port)) == 0
+        except OSError:
+            return False
+
+
+def _open_listener(host: str, port: int) -> Optional[socket.socket]:
+    """Bind and listen on ``host:port`` so the socket can be handed to the daemon.
+
+    Returns ``None`` where descriptor handoff is unsupported (non-POSIX).
+    """
+
+    if os.name != "posix":
+        return None
+    family, socktype, proto, _, sockaddr = socket.getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    )[0]
+    sock = socket.socket(family, socktype, proto)
     try:
-        with socket.create_connection((host, port), timeout):
-            return True
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(sockaddr)
+        sock.listen(128)
     except OSError:
-        return False
+        sock.close()
+        raise
+    return sock
 
 
 def _pick_free_port(host: str) -> int:
@@ -242,12 +430,145 @@ def _pick_free_port(host: str) -> int:
         return sock.getsockname()[1]
 
 
-def _await_daemon(host: str, port: int, retries: int = 50, delay: float = 0.1) -> None:
-    for _ in range(retries):
-        if _ping_daemon(host, port, timeout=delay):
-            return
-        time.sleep(delay)
-    raise RuntimeError("daemon did not become ready in time")
+def _open_pidfd(pid: int) -> Optional[int]:
+    """Return a pidfd for ``pid`` or ``None`` when the platform lacks them."""
+
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _select_events(sel: selectors.BaseSelector, timeout: float) -> List[Any]:
+    if not sel.get_map():
+        time.sleep(timeout)
+        return []
+    return [key.data for key, _ in sel.select(timeout)]
+
+
+_READINESS_HANDSHAKE = (
+    _json.dumps_bytes(
+        {
+            "id": 0,
+            "command": "handshake",
+            "params": {"client": "duet-cli", "protocol_version": PROTOCOL_VERSION},
+        }
+    )
+    + b"\n"
+)
+
+
+def _confirm_handshake(
+    sock: socket.socket,
+    sel: selectors.BaseSelector,
+    deadline: float,
+    check_exit: Callable[[List[Any]], None],
+) -> bool:
+    """Exchange a handshake on a connected probe socket.
+
+    A completed TCP connect only proves the port is bound; with an inherited
+    listener it succeeds before the daemon is serving, so wait for a reply.
+    """
+
+    try:
+        sock.sendall(_READINESS_HANDSHAKE)
+    except OSError:
+        return False
+
+    buffer = b""
+    sel.register(sock, selectors.EVENT_READ, "reply")
+    try:
+        while b"\n" not in buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            events = _select_events(sel, remaining)
+            check_exit(events)
+            if "reply" in events:
+                try:
+                    chunk = sock.recv(4096)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    return False
+                if not chunk:
+                    return False
+                buffer += chunk
+    finally:
+        sel.unregister(sock)
+
+    try:
+        response = _json.loads(buffer.split(b"\n", 1)[0])
+    except ValueError:
+        # Not a codebased reply (another service on the port, or a garbled
+        # line); treat it like any other failed probe.
+        return False
+    if isinstance(response, dict) and "error" in response:
+        raise RuntimeError(f"daemon rejected handshake: {response['error']}")
+    return True
+
+
+def _await_daemon(
+    host: str,
+    port: int,
+    process: Optional[subprocess.Popen] = None,
+    timeout: float = 5.0,
+    delay: float = 0.05,
+) -> None:
+    """Block until the daemon answers a handshake or its process exits.
+
+    Connection attempts are non-blocking and multiplexed with a pidfd for the
+    child (where supported), so a crashed daemon is reported immediately
+    instead of after the full timeout.
+    """
+
+    family, socktype, proto, _, sockaddr = socket.getaddrinfo(
+        host, port, type=socket.SOCK_STREAM
+    )[0]
+    pidfd = _open_pidfd(process.pid) if process is not None else None
+    deadline = time.monotonic() + timeout
+
+    def check_exit(events: List[Any]) -> None:
+        if "exit" in events or (process is not None and process.poll() is not None):
+            code = process.wait() if process is not None else None
+            raise RuntimeError(f"daemon exited during startup (status {code})")
+
+    try:
+        with selectors.DefaultSelector() as sel:
+            if pidfd is not None:
+                sel.register(pidfd, selectors.EVENT_READ, "exit")
+            while True:
+                check_exit([])
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError("daemon did not become ready in time")
+
+                with socket.socket(family, socktype, proto) as sock:
+                    sock.setblocking(False)
+                    err = sock.connect_ex(sockaddr)
+                    if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        sel.register(sock, selectors.EVENT_WRITE, "connect")
+                        try:
+                            events = _select_events(sel, remaining)
+                        finally:
+                            sel.unregister(sock)
+                        check_exit(events)
+                        if "connect" in events:
+                            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if err == 0 and _confirm_handshake(sock, sel, deadline, check_exit):
+                        return
+
+                # Nothing is listening yet; back off briefly, waking early if
+                # the child exits in the meantime.
+                remaining = deadline - time.monotonic()
+                check_exit(_select_events(sel, max(min(delay, remaining), 0)))
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
 
 @dataclass
 class CLIState:
@@ -257,6 +578,14 @@ class CLIState:
     codebased_bin: Optional[Path]
     daemon_host: Optional[str]
     daemon_port: Optional[int]
+    # Client reused across _client_scope blocks; see there for lifetime.
+    client: Optional[ControlClient] = None
+
+    @functools.cached_property
+    def root_path(self) -> Path:
+        """The resolved runtime directory, looked up once per invocation."""
+
+        return _resolve_root_path(self.root)
 
 
 def _show_group_help(ctx: typer.Context, examples: Optional[List[str]] = None) -> NoReturn:
@@ -270,11 +599,72 @@ def _show_group_help(ctx: typer.Context, examples: Optional[List[str]] = None) -
     raise typer.Exit()
 
 
+_EVENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop, creating it on first use."""
+
+    # asyncio is imported on first use rather than at module load: it costs
+    # tens of milliseconds and `duet --help` or the `codebased` lifecycle
+    # commands never need it.
+    import asyncio
+
+    global _EVENT_LOOP
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        try:  # Optional accelerated event loop (installed via the ``fast`` extra)
+            import uvloop
+        except ImportError:  # pragma: no cover - depends on the environment
+            uvloop = None
+        if uvloop is not None and os.name != "nt":
+            loop = uvloop.new_event_loop()
+        else:
+            loop = asyncio.new_event_loop()
+        if _EVENT_LOOP is None:
+            atexit.register(_close_event_loop)
+        asyncio.set_event_loop(loop)
+        _EVENT_LOOP = loop
+    return _EVENT_LOOP
+
+
+def _close_event_loop() -> None:
+    import asyncio
+
+    loop = _EVENT_LOOP
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """Run ``coro`` to completion on the shared loop, preferring uvloop."""
+
+    loop = _event_loop()
+    task = loop.create_task(coro)
+    try:
+        return loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        # Let the coroutine unwind (closing clients, reaping subprocesses)
+        # before the interrupt propagates to the caller. If the interrupt
+        # was raised inside the task it has already finished, and waiting
+        # on it again would never return.
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(BaseException):
+                loop.run_until_complete(task)
+        raise
+
+
 def _run(coro: asyncio.Future[Any]) -> None:
     """Execute an async coroutine with unified error handling."""
 
     try:
-        asyncio.run(coro)
+        _run_coroutine(coro)
     except ProtocolError as exc:  # pragma: no cover - exercised via integration
         _print_protocol_error(exc)
         raise typer.Exit(1)
@@ -282,7 +672,10 @@ def _run(coro: asyncio.Future[Any]) -> None:
         _print_launch_error(exc)
         raise typer.Exit(1)
     except KeyboardInterrupt:  # pragma: no cover - manual interrupt
-        console.print("\n[yellow]Interrupted by user[/yellow]")
+        if _PLAIN_OUTPUT:
+            _write_plain_error("interrupted by user")
+        else:
+            console.print("\n[yellow]Interrupted by user[/yellow]")
         raise typer.Exit(130)
     except Exception as exc:  # pragma: no cover - safety net
         _print_unexpected_error(exc)
@@ -316,6 +709,16 @@ def main(
         max=65535,
         rich_help_panel="Global Options",
     ),
+    plain: Optional[bool] = typer.Option(  # noqa: B008
+        None,
+        "--plain/--no-plain",
+        envvar="DUET_PLAIN",
+        help=(
+            "Emit raw JSON lines instead of Rich-formatted output "
+            "(default: on when stdout is not a terminal)."
+        ),
+        rich_help_panel="Global Options",
+    ),
 ) -> None:
     """Top-level callback storing shared CLI state."""
 
@@ -324,6 +727,17 @@ def main(
             "Provide both --daemon-host and --daemon-port to connect to a remote daemon."
         )
 
+    global _PLAIN_OUTPUT
+    if plain is None:
+        plain = not console.is_terminal
+    _PLAIN_OUTPUT = _PLAIN_FORCED or plain
+    ctx.call_on_close(_reset_output_mode)
+    if _PLAIN_OUTPUT:
+        # stdout carries only result lines; notices, progress and prompts
+        # go to stderr so `duet ... | jq` keeps working. Undone when the
+        # invocation ends so embedding callers get their console back.
+        console.stderr = True
+
     ctx.obj = CLIState(
         root=root,
         codebased_bin=codebased_bin,
@@ -335,6 +749,12 @@ def main(
         _show_group_help(ctx)
 
 
+def _reset_output_mode() -> None:
+    global _PLAIN_OUTPUT
+    _PLAIN_OUTPUT = False
+    console.stderr = False
+
+
 @time_app.command("status")
 def status(
     ctx: typer.Context,
@@ -358,7 +778,7 @@ def history(
     """Show branch turn history."""
 
     params = {"branch": branch, "start": start, "limit": limit}
-    _run(_run_call(ctx.obj, "history", params, "history"))
+    _run(_run_history(ctx.obj, params))
 
 
 @debug_app.command("send")
@@ -481,6 +901,35 @@ def raw(
     _run(_run_call(ctx.obj, rpc_command, payload, "raw"))
 
 
+@debug_app.command("raw-batch")
+def raw_batch(ctx: typer.Context) -> None:
+    """Send newline-delimited raw commands from stdin over one connection.
+
+    Each line is a JSON object with a ``command`` and optional ``params``.
+    Every line is validated before anything is sent; results print in
+    order, and the first protocol error stops the batch.
+    """
+
+    calls: List[Tuple[str, Dict[str, Any]]] = []
+    for number, line in enumerate(sys.stdin, start=1):
+        if not line.strip():
+            continue
+        try:
+            request = json_loads(line)
+        except ValueError as exc:
+            raise typer.BadParameter(f"line {number}: invalid JSON ({exc})") from None
+        command = request.get("command") if isinstance(request, dict) else None
+        params = request.get("params", {}) if isinstance(request, dict) else None
+        if not isinstance(command, str) or not isinstance(params, dict):
+            raise typer.BadParameter(
+                f"line {number}: expected an object with a string 'command' and object 'params'"
+            )
+        calls.append((command, params))
+
+    if calls:
+        _run(_run_raw_batch(ctx.obj, calls))
+
+
 @debug_app.command("workspace-entries")
 def workspace_entries(ctx: typer.Context) -> None:
     """List workspace dataspace entries."""
@@ -612,7 +1061,7 @@ def chat(
     if not agent.strip():
         raise typer.BadParameter("--agent cannot be empty")
 
-    message = prompt or typer.prompt("Prompt")
+    message = prompt or typer.prompt("Prompt", err=_PLAIN_OUTPUT)
 
     resume_id = resume_request_id
     if continue_last:
@@ -745,6 +1194,28 @@ def actors_root(
     )
 
 
+def _reaction_value_spec(
+    option: str, literal: Optional[str], from_match: bool, match_index: Optional[int]
+) -> Dict[str, Any]:
+    """Build a reaction value spec from the mutually exclusive ``--<option>*`` flags."""
+
+    if (literal is not None) + from_match + (match_index is not None) > 1:
+        raise typer.BadParameter(
+            f"Use only one of --{option}, --{option}-from-match, or --{option}-match-index",
+            param_hint=option,
+        )
+    if match_index is not None:
+        return {"type": "match-index", "index": match_index}
+    if from_match:
+        return {"type": "match"}
+    if literal is None:
+        raise typer.BadParameter(
+            f"--{option} is required unless --{option}-from-match or --{option}-match-index is provided",
+            param_hint=option,
+        )
+    return {"type": "literal", "value": literal}
+
+
 @reaction_app.command("register")
 def reaction_register(
     ctx: typer.Context,
@@ -785,32 +1256,7 @@ def reaction_register(
 
     effect_key = effect.lower()
     if effect_key == "assert":
-        if sum(
-            [
-                1 if value is not None else 0,
-                1 if value_from_match else 0,
-                1 if value_match_index is not None else 0,
-            ]
-        ) > 1:
-            raise typer.BadParameter(
-                "Use only one of --value, --value-from-match, or --value-match-index",
-                param_hint="value",
-            )
-        if value_match_index is not None:
-            value_spec: Dict[str, Any] = {
-                "type": "match-index",
-                "index": value_match_index,
-            }
-        elif value_from_match:
-            value_spec: Dict[str, Any] = {"type": "match"}
-        else:
-            if value is None:
-                raise typer.BadParameter(
-                    "--value is required unless --value-from-match or --value-match-index is provided",
-                    param_hint="value",
-                )
-            value_spec = {"type": "literal", "value": value}
-
+        value_spec = _reaction_value_spec("value", value, value_from_match, value_match_index)
         effect_payload = {"type": "assert", "value": value_spec}
         if target_facet:
             effect_payload["target_facet"] = target_facet
@@ -820,32 +1266,7 @@ def reaction_register(
                 "--target-actor and --target-facet-msg are required for send-message effect",
                 param_hint="effect",
             )
-        if sum(
-            [
-                1 if payload is not None else 0,
-                1 if payload_from_match else 0,
-                1 if payload_match_index is not None else 0,
-            ]
-        ) > 1:
-            raise typer.BadParameter(
-                "Use only one of --payload, --payload-from-match, or --payload-match-index",
-                param_hint="payload",
-            )
-        if payload_match_index is not None:
-            payload_spec = {
-                "type": "match-index",
-                "index": payload_match_index,
-            }
-        elif payload_from_match:
-            payload_spec = {"type": "match"}
-        else:
-            if payload is None:
-                raise typer.BadParameter(
-                    "--payload is required unless --payload-from-match or --payload-match-index is provided",
-                    param_hint="payload",
-                )
-            payload_spec = {"type": "literal", "value": payload}
-
+        payload_spec = _reaction_value_spec("payload", payload, payload_from_match, payload_match_index)
         effect_payload = {
             "type": "send-message",
             "actor": target_actor,
@@ -916,7 +1337,7 @@ def daemon_start(
 ) -> None:
     """Start the local codebased daemon in the background."""
 
-    root = _ensure_root_dir(ctx.obj.root)
+    root = _ensure_root_dir(ctx.obj.root_path)
     existing = _load_daemon_state(root)
     if existing and _ping_daemon(existing.host, existing.port):
         console.print(
@@ -924,44 +1345,102 @@ def daemon_start(
         )
         return
 
+    try:
+        listener = _open_listener(host, port or 0)
+    except OSError as exc:
+        where = f"{host}:{port}" if port is not None else f"{host} (any free port)"
+        console.print(f"[red]Cannot listen on {where}: {exc}[/red]")
+        raise typer.Exit(1)
     if port is None:
-        port = _pick_free_port(host)
+        port = listener.getsockname()[1] if listener is not None else _pick_free_port(host)
 
     cmd = list(_codebased_command(ctx.obj))
     if "--stdio" in cmd:
         cmd.remove("--stdio")
     cmd.extend(["--root", str(root)])
-    cmd.extend(["--listen", f"{host}:{port}"])
 
     log_path = root / DAEMON_LOG_FILE
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_path, "ab") as log_file:
-        process = subprocess.Popen(
+
+    process: Optional[subprocess.Popen] = None
+    if listener is not None:
+        # Hand the bound socket to the daemon so nothing can claim the port
+        # between picking it and the daemon binding it.
+        fd = listener.fileno()
+        try:
+            process = _spawn_daemon([*cmd, "--listen-fd", str(fd)], log_path, (fd,))
+        finally:
+            listener.close()
+        try:
+            _await_daemon(host, port, process)
+        except RuntimeError as exc:
+            if process.poll() is None:
+                _abort_daemon_start(process, exc, log_path)
+            # Exited straight away: most likely a codebased build without
+            # --listen-fd, so retry binding by address below.
+            process = None
+
+    if process is None:
+        process = _spawn_daemon([*cmd, "--listen", f"{host}:{port}"], log_path)
+        try:
+            _await_daemon(host, port, process)
+        except RuntimeError as exc:
+            _abort_daemon_start(process, exc, log_path)
+
+    _save_daemon_state(
+        DaemonState(
+            pid=process.pid,
+            host=host,
+            port=port,
+            root=root,
+            started=_process_start_time(process.pid),
+        )
+    )
+    console.print(
+        f"[green]Daemon listening on {host}:{port} (pid {process.pid}). Log: {log_path}[/green]"
+    )
+
+
+def _spawn_daemon(
+    cmd: List[str], log_path: Path, pass_fds: Tuple[int, ...] = ()
+) -> subprocess.Popen:
+    # Hand the child a raw append-mode descriptor; Popen dups it onto the
+    # child's stdout, so no buffered file object is needed on our side.
+    log_fd = os.open(
+        log_path,
+        os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0),
+        0o644,
+    )
+    try:
+        return subprocess.Popen(
             cmd,
             stdin=subprocess.DEVNULL,
-            stdout=log_file,
+            stdout=log_fd,
             stderr=subprocess.STDOUT,
+            pass_fds=pass_fds,
         )
+    finally:
+        os.close(log_fd)
 
-    try:
-        _await_daemon(host, port)
-    except RuntimeError:
-        with contextlib.suppress(ProcessLookupError):
-            os.kill(process.pid, signal.SIGTERM)
-        console.print("[red]Failed to start daemon[/red]")
-        raise typer.Exit(1)
 
-    _save_daemon_state(DaemonState(pid=process.pid, host=host, port=port, root=root))
-    console.print(
-        f"[green]Daemon listening on {host}:{port} (pid {process.pid}). Log: {log_path}[/green]"
-    )
+def _abort_daemon_start(
+    process: subprocess.Popen, reason: Exception, log_path: Path
+) -> NoReturn:
+    if process.poll() is None:
+        with contextlib.suppress(ProcessLookupError):
+            process.terminate()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            process.wait(timeout=1.0)
+    console.print(f"[red]Failed to start daemon: {reason}[/red]")
+    console.print(f"[dim]See {log_path} for daemon output.[/dim]")
+    raise typer.Exit(1)
 
 
 @codebased_app.command("stop")
 def daemon_stop(ctx: typer.Context) -> None:
     """Stop the background daemon if it is running."""
 
-    root = _resolve_root_path(ctx.obj.root)
+    root = ctx.obj.root_path
     _stop_daemon_if_running(root)
 
 
@@ -969,7 +1448,7 @@ def daemon_stop(ctx: typer.Context) -> None:
 def daemon_status(ctx: typer.Context) -> None:
     """Report the status of the local codebased daemon."""
 
-    root = _resolve_root_path(ctx.obj.root)
+    root = ctx.obj.root_path
     state = _load_daemon_state(root)
     if not state:
         console.print("[yellow]Daemon is not running.[/yellow]")
@@ -1001,7 +1480,7 @@ def clear_runtime(
 ) -> None:
     """Stop the daemon and delete all local runtime state."""
 
-    root = _resolve_root_path(ctx.obj.root)
+    root = ctx.obj.root_path
     root_display = str(root)
 
     if not force:
@@ -1014,7 +1493,9 @@ def clear_runtime(
         )
         console.print(warning)
         try:
-            proceed = typer.confirm("Proceed with clearing the runtime?", default=False)
+            proceed = typer.confirm(
+                "Proceed with clearing the runtime?", default=False, err=_PLAIN_OUTPUT
+            )
         except typer.Abort:
             console.print("[yellow]Aborted; runtime state left intact.[/yellow]")
             raise typer.Exit(1)
@@ -1097,7 +1578,7 @@ def dataspace_tail(
 def json_loads(payload: str) -> Any:
     """Parse JSON with helpful error messages."""
 
-    return json.loads(payload)
+    return _json.loads(payload)
 
 
 async def _run_status(state: CLIState, branch: Optional[str]) -> None:
@@ -1108,30 +1589,85 @@ async def _run_status(state: CLIState, branch: Optional[str]) -> None:
 
 
 async def _run_send_message(state: CLIState, actor: str, facet: str, payload: str) -> None:
-    client = await _connect_client(state)
-    try:
+    async with _client_scope(state) as client:
         result = await client.send_message(actor, facet, payload)
         _print_result(result, "send")
-    finally:
-        await client.close()
 
 
 async def _run_invoke_capability(state: CLIState, capability: str, payload: str) -> None:
-    client = await _connect_client(state)
-    try:
+    async with _client_scope(state) as client:
         result = await client.invoke_capability(capability, payload)
         _print_result(result, "invoke-capability")
-    finally:
-        await client.close()
 
 
 async def _run_call(state: CLIState, rpc_command: str, params: Dict[str, Any], pretty_command: str) -> None:
-    client = await _connect_client(state)
-    try:
+    async with _client_scope(state) as client:
         result = await client.call(rpc_command, params)
         _print_result(result, pretty_command)
-    finally:
-        await client.close()
+
+
+async def _run_raw_batch(state: CLIState, calls: List[Tuple[str, Dict[str, Any]]]) -> None:
+    async with _client_scope(state) as client:
+        for rpc_command, params in calls:
+            _print_result(await client.call(rpc_command, params), "raw")
+
+
+async def _run_history(state: CLIState, params: Dict[str, Any]) -> None:
+    """Fetch a long history slice page by page into one table.
+
+    Each page's rows are added while the request for the next page is
+    already in flight. The table prints once at the end so its columns are
+    sized over every row.
+    """
+
+    import asyncio
+
+    limit = params["limit"]
+    if _PLAIN_OUTPUT or limit <= HISTORY_PAGE_TURNS:
+        await _run_call(state, "history", params, "history")
+        return
+
+    async with _client_scope(state) as client:
+        pending: Optional[asyncio.Future] = None
+
+        def fetch(start: int, count: int) -> asyncio.Future:
+            page_params = {**params, "start": start, "limit": count}
+            return asyncio.ensure_future(client.call("history", page_params))
+
+        try:
+            start = params["start"]
+            remaining = limit
+            requested = min(remaining, HISTORY_PAGE_TURNS)
+            pending = fetch(start, requested)
+            table: Optional[Table] = None
+            while pending is not None:
+                result = await pending
+                pending = None
+                turns = result.get("turns") if isinstance(result, dict) else None
+                if not turns:
+                    if table is None:
+                        _print_history(result)
+                    break
+
+                start += len(turns)
+                remaining -= len(turns)
+                if remaining > 0 and len(turns) == requested:
+                    requested = min(remaining, HISTORY_PAGE_TURNS)
+                    pending = fetch(start, requested)
+                    # Let the prefetch write its request before building
+                    # rows blocks the event loop.
+                    await asyncio.sleep(0)
+
+                if table is None:
+                    table = _new_table(_HISTORY_COLUMNS, "Turn History", "blue")
+                _add_text_rows(table, _history_rows(turns))
+            if table is not None:
+                console.print(table)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await pending
 
 
 async def _workflow_start_command(
@@ -1141,11 +1677,11 @@ async def _workflow_start_command(
     try:
         result = await client.call("workflow_start", params)
         if not interactive:
-            _print_workflow_start(result)
+            _print_result(result, "workflow:start")
             return
 
         if not isinstance(result, dict):
-            _print_workflow_start(result)
+            _print_result(result, "workflow:start")
             console.print(
                 "[red]Interactive mode requires definition metadata; falling back to batch output.[/red]"
             )
@@ -1153,7 +1689,7 @@ async def _workflow_start_command(
 
         instance = result.get("instance")
         if not isinstance(instance, dict):
-            _print_workflow_start(result)
+            _print_result(result, "workflow:start")
             console.print(
                 "[red]Workflow start response did not include instance details; cannot enter interactive mode.[/red]"
             )
@@ -1161,7 +1697,7 @@ async def _workflow_start_command(
 
         instance_id = instance.get("id")
         if not isinstance(instance_id, str):
-            _print_workflow_start(result)
+            _print_result(result, "workflow:start")
             console.print(
                 "[red]Workflow start response missing instance id; cannot enter interactive mode.[/red]"
             )
@@ -1180,6 +1716,10 @@ async def _workflow_start_command(
 
 
 async def _workflow_interactive_loop(client: ControlClient, instance_id: str) -> None:
+    import asyncio
+
+    from rich.live import Live  # only the interactive workflow view needs it
+
     refresh_interval = 0.5
 
     last_instance: Dict[str, Any] = {}
@@ -1248,6 +1788,8 @@ async def _workflow_interactive_loop(client: ControlClient, instance_id: str) ->
 
 
 async def _prompt_for_input(prompt_entry: Dict[str, Any]) -> Optional[str]:
+    import asyncio
+
     header = f"Prompt {prompt_entry.get('request_id', '?')}"
     tag = prompt_entry.get("tag")
     if tag:
@@ -1343,8 +1885,9 @@ async def _run_agent_chat(
     agent: str,
     inspect: bool,
 ) -> None:
-    client = await _connect_client(state)
-    try:
+    import asyncio
+
+    async with _client_scope(state) as client:
         final_prompt = prompt
         if resume_request_id:
             final_prompt = await _augment_prompt_with_history(
@@ -1360,7 +1903,7 @@ async def _run_agent_chat(
         if prompt is not None:
             invoke_result.setdefault("prompt_preview", prompt)
 
-        if inspect:
+        if inspect or _PLAIN_OUTPUT:
             _print_result(invoke_result, "agent:invoke")
 
         if wait_for_response:
@@ -1394,8 +1937,6 @@ async def _run_agent_chat(
             params["wait_ms"] = int(extra_wait * 1000)
             follow_up = await client.call("agent_responses", params)
             _print_result(follow_up, "agent:responses")
-    finally:
-        await client.close()
 
 
 async def _run_query_actors(
@@ -1404,15 +1945,14 @@ async def _run_query_actors(
     include_assertions: bool,
     assertions_limit: int,
 ) -> None:
-    client = await _connect_client(state)
-    try:
+    async with _client_scope(state) as client:
         params: Dict[str, Any] = {}
         if actor_filter:
             params["actor"] = actor_filter
 
         entities_result = await client.call("list_entities", params)
         if not isinstance(entities_result, dict):
-            console.print(JSON.from_data(entities_result))
+            _print_result(entities_result, "json")
             return
 
         raw_entities = entities_result.get("entities") or []
@@ -1483,6 +2023,21 @@ async def _run_query_actors(
                     ]
                     ensure_summary(actor_id)["assertions"] = assertions
 
+        if _PLAIN_OUTPUT:
+            _write_plain_result({
+                "actors": [
+                    {
+                        "actor": actor_id,
+                        "entity_types": dict(summary["entity_types"]),
+                        "facets": sorted(summary["facets"]),
+                        "entities": summary["entities"],
+                        "assertions": summary["assertions"],
+                    }
+                    for actor_id, summary in sorted(summaries.items(), key=lambda item: item[0])
+                ]
+            })
+            return
+
         if not summaries:
             console.print("[yellow]No actors found.[/yellow]")
             return
@@ -1492,8 +2047,6 @@ async def _run_query_actors(
             for actor_id, summary in sorted(summaries.items(), key=lambda item: item[0])
         ]
         console.print(Group(*panels) if len(panels) > 1 else panels[0])
-    finally:
-        await client.close()
 
 
 async def _augment_prompt_with_history(
@@ -1530,57 +2083,96 @@ async def _augment_prompt_with_history(
         )
         return prompt
 
-    history_lines: List[str] = []
-    for entry in entries[-history_limit:]:
-        prior_prompt = entry.get("prompt")
-        prior_response = entry.get("response")
-        if prior_prompt:
-            history_lines.append(f"User: {prior_prompt}")
-        if prior_response:
-            history_lines.append(f"Assistant: {prior_response}")
-
-    history_text = "\n\n".join(history_lines).strip()
+    # Walk newest-first and stop at the first entry that would push the
+    # combined prompt past the budget, so the oldest context is what drops.
+    suffix = f"\n\nUser: {prompt}"
+    remaining = RESUME_PROMPT_BUDGET - len(suffix)
+    lines: Deque[str] = deque()
+    included = 0
+    truncated = False
+    for entry in reversed(entries[-history_limit:]):
+        entry_lines = [
+            f"{label}: {text}"
+            for label, text in (("Assistant", entry.get("response")), ("User", entry.get("prompt")))
+            if text
+        ]
+        if not entry_lines:
+            continue
+        cost = sum(len(line) + 2 for line in entry_lines)
+        if cost > remaining:
+            truncated = True
+            break
+        remaining -= cost
+        lines.extendleft(entry_lines)
+        included += 1
+
+    history_text = "\n\n".join(lines).strip()
     if not history_text:
+        reason = (
+            "did not fit in the 16k character prompt budget"
+            if truncated
+            else "contained no usable text"
+        )
         console.print(
             Panel(
-                f"[yellow]Transcript for {resume_request_id} contained no usable text; proceeding without context.[/yellow]",
+                f"[yellow]Transcript for {resume_request_id} {reason}; proceeding without context.[/yellow]",
                 border_style="yellow",
             )
         )
         return prompt
 
-    included = len(entries[-history_limit:])
-    console.print(
-        Panel(
-            f"[bold]Resuming conversation[/bold]\nRequest: {resume_request_id}\nEntries included: {included}",
-            border_style="blue",
-        )
-    )
+    summary = f"[bold]Resuming conversation[/bold]\nRequest: {resume_request_id}\nEntries included: {included}"
+    if truncated:
+        summary += "\n[yellow]Older entries omitted to stay within 16k characters.[/yellow]"
+    console.print(Panel(summary, border_style="blue"))
 
-    combined_prompt = f"{history_text}\n\nUser: {prompt}"
-    if len(combined_prompt) > 16000:
-        console.print(
-            Panel(
-                "[yellow]Combined prompt exceeds 16k characters; the agent may truncate context.[/yellow]",
-                border_style="yellow",
-            )
-        )
-    return combined_prompt
+    return history_text + suffix
+
+
+def _resolve_daemon_addr(root: Path) -> Optional[Tuple[str, int]]:
+    cached = _DAEMON_ADDR_CACHE.get(root)
+    if cached is not None:
+        return cached
+
+    # _load_daemon_state already dropped records for dead processes. There
+    # is no TCP ping either: the handshake in _connect_client is the health
+    # check.
+    daemon_state = _load_daemon_state(root)
+    if not daemon_state:
+        return None
+
+    addr = (daemon_state.host, daemon_state.port)
+    _DAEMON_ADDR_CACHE[root] = addr
+    return addr
 
 
 async def _connect_client(state: CLIState) -> ControlClient:
     runtime_addr: Optional[Tuple[str, int]] = None
-    root = _resolve_root_path(state.root)
+    root = state.root_path
 
     if state.daemon_host and state.daemon_port:
         runtime_addr = (state.daemon_host, state.daemon_port)
     else:
-        daemon_state = _load_daemon_state(root)
-        if daemon_state:
-            if _is_process_alive(daemon_state.pid) and _ping_daemon(daemon_state.host, daemon_state.port):
-                runtime_addr = (daemon_state.host, daemon_state.port)
-            else:
+        runtime_addr = _resolve_daemon_addr(root)
+        if runtime_addr:
+            client = ControlClient(runtime_addr=runtime_addr)
+            try:
+                await client.connect()
+            except OSError:
+                # The recorded daemon is not answering; forget it and fall
+                # back to stdio below.
+                with contextlib.suppress(OSError):
+                    await client.close()
                 _clear_daemon_state(root)
+                runtime_addr = None
+            except ProtocolError:
+                # The daemon is up but rejected us (e.g. a protocol version
+                # mismatch); report that rather than bypassing it.
+                with contextlib.suppress(OSError):
+                    await client.close()
+                raise
+            else:
+                return client
 
     if runtime_addr:
         client = ControlClient(runtime_addr=runtime_addr)
@@ -1592,17 +2184,68 @@ async def _connect_client(state: CLIState) -> ControlClient:
     return client
 
 
+@contextlib.asynccontextmanager
+async def _client_scope(state: CLIState) -> AsyncIterator[ControlClient]:
+    """Yield a client for ``state``, reusing one an enclosing scope opened.
+
+    A daemon serves one connection at a time, so a TCP client is closed
+    when the outermost scope exits. A private ``codebased --stdio`` runtime
+    blocks nobody else and is kept for later coroutines in the invocation
+    (resolving ``--continue`` before chatting, say) instead of respawning,
+    until _close_shared_client runs. Any failure other than a
+    daemon-reported error closes the client, since an interrupted call can
+    leave a reply unread on the stream.
+    """
+
+    client = state.client
+    created = client is None
+    if client is None:
+        client = await _connect_client(state)
+        state.client = client
+        if client.runtime_addr is None:
+            atexit.register(_close_shared_client, state)
+    release = False
+    try:
+        yield client
+    except ProtocolError:
+        raise
+    except BaseException:
+        release = True
+        raise
+    finally:
+        # An inner scope that already released the client has cleared
+        # state.client, so enclosing scopes do not close it a second time.
+        if (release or (created and client.runtime_addr is not None)) and state.client is client:
+            state.client = None
+            with contextlib.suppress(Exception):
+                await client.close()
+
+
+def _close_shared_client(state: CLIState) -> None:
+    """Close the invocation's kept stdio client, if any.
+
+    Called before blocking on user input and at exit. The atexit hook is
+    registered after the event loop's own, so it runs while the loop is
+    still open.
+    """
+
+    client = state.client
+    state.client = None
+    loop = _EVENT_LOOP
+    if client is None or loop is None or loop.is_closed():
+        return
+    with contextlib.suppress(Exception):
+        loop.run_until_complete(client.close())
+
+
 async def _fetch_recent_requests(
     state: CLIState, limit: int, agent: Optional[str] = None
 ) -> List[Dict[str, Any]]:
-    client = await _connect_client(state)
-    try:
+    async with _client_scope(state) as client:
         params: Dict[str, Any] = {"limit": limit, "wait_ms": 0}
         if agent:
             params["agent"] = agent
         result = await client.call("agent_responses", params)
-    finally:
-        await client.close()
 
     if isinstance(result, dict):
         responses = result.get("responses")
@@ -1615,7 +2258,7 @@ def _choose_request_id(
     state: CLIState, *, title: str, limit: int = 20, agent: Optional[str] = None
 ) -> Optional[str]:
     try:
-        responses = asyncio.run(_fetch_recent_requests(state, limit, agent))
+        responses = _run_coroutine(_fetch_recent_requests(state, limit, agent))
     except ProtocolError as exc:  # pragma: no cover - interactive path
         _print_protocol_error(exc)
         return None
@@ -1645,6 +2288,7 @@ def _choose_request_id(
     idx_col_width = max(len(str(len(unique))), 2)
     truncated = [str(entry.get("request_id", "")) for entry in unique]
 
+    options: List[Panel] = []
     for idx, (entry, full_rid) in enumerate(zip(unique, truncated), start=1):
         agent = entry.get("agent", "agent")
         timestamp_raw = entry.get("timestamp", "")
@@ -1652,7 +2296,7 @@ def _choose_request_id(
         short_rid = _short_id(full_rid)
         tags = _extract_keywords([_clean_user_message(entry.get("prompt"))])
         tag_text = _format_tags(tags) or "(no tags)"
-        console.print(Panel.fit(
+        options.append(Panel.fit(
             Group(
                 Text.assemble(("Request: ", "dim"), (short_rid or "-", "yellow")),
                 Text.assemble(("Agent: ", "dim"), (agent, "magenta")),
@@ -1664,9 +2308,14 @@ def _choose_request_id(
             border_style="blue",
             box=box.ROUNDED,
         ))
+    console.print(Group(*options))
 
+    # Nothing else runs while the user picks; don't hold a runtime open.
+    _close_shared_client(state)
     while True:
-        choice = typer.prompt("Select request (blank to cancel)", default="").strip()
+        choice = typer.prompt(
+            "Select request (blank to cancel)", default="", err=_PLAIN_OUTPUT
+        ).strip()
         if choice == "":
             return None
         if choice.isdigit():
@@ -1690,7 +2339,7 @@ def _metadata_block(pairs: Iterable[Tuple[str, Optional[str]]]) -> Optional[Grou
 
 def _latest_request_id(state: CLIState, agent: Optional[str] = None) -> Optional[str]:
     try:
-        responses = asyncio.run(_fetch_recent_requests(state, 1, agent))
+        responses = _run_coroutine(_fetch_recent_requests(state, 1, agent))
     except Exception:
         return None
     if responses:
@@ -1702,7 +2351,7 @@ def _recent_prompt_for_request(
     state: CLIState, request_id: str, agent: Optional[str] = None
 ) -> Optional[str]:
     try:
-        responses = asyncio.run(_fetch_recent_requests(state, 20, agent))
+        responses = _run_coroutine(_fetch_recent_requests(state, 20, agent))
     except Exception:
         return None
     for entry in responses:
@@ -1726,7 +2375,7 @@ def debug_agent_requests(
     """List recent agent request identifiers with full metadata."""
 
     try:
-        responses = asyncio.run(_fetch_recent_requests(ctx.obj, limit, agent))
+        responses = _run_coroutine(_fetch_recent_requests(ctx.obj, limit, agent))
     except ProtocolError as exc:
         _print_protocol_error(exc)
         raise typer.Exit(1)
@@ -1739,10 +2388,18 @@ def debug_agent_requests(
         _print_unexpected_error(exc)
         raise typer.Exit(1)
 
+    _print_result(responses, "agent:requests")
+
+
+def _print_agent_requests(responses: Any) -> None:
+    if not isinstance(responses, list):
+        console.print(JSON.from_data(responses))
+        return
     if not responses:
         console.print("[yellow]No agent requests recorded yet.[/yellow]")
         return
 
+    panels: List[Panel] = []
     for idx, entry in enumerate(responses, start=1):
         request_id = str(entry.get("request_id", ""))
         agent = entry.get("agent", "agent")
@@ -1767,11 +2424,17 @@ def debug_agent_requests(
             body_parts.append(Text("Tags: (none)", style="dim"))
         body = Group(*body_parts) if len(body_parts) > 1 else body_parts[0]
 
-        console.print(Panel(body, border_style="blue", box=box.ROUNDED, title=f"Request {idx}"))
+        panels.append(Panel(body, border_style="blue", box=box.ROUNDED, title=f"Request {idx}"))
+
+    console.print(Group(*panels))
 
 
 def _message_panel(label: str, content: Optional[str], *, border_style: str, subtitle: Optional[str] = None) -> Panel:
     if content and content.strip():
+        # rich.markdown pulls in markdown-it and pygments; only pay for that
+        # import when a message actually needs rendering.
+        from rich.markdown import Markdown
+
         body = Markdown(content, code_theme="monokai")
     else:
         body = Text("No content", style="dim")
@@ -1841,6 +2504,15 @@ def _preview_text(text: Optional[str], length: int = 60) -> Optional[str]:
     return collapsed[: length - 1] + "…"
 
 
+def _shorten(value: Any, length: int = 12, suffix: str = "...") -> str:
+    """Truncate ``str(value)`` to ``length`` characters, marking cuts with ``suffix``."""
+
+    text = value if type(value) is str else str(value)
+    if len(text) <= length:
+        return text
+    return text[:length] + suffix
+
+
 def _short_id(value: Optional[str], length: int = 8) -> Optional[str]:
     if not value:
         return None
@@ -1951,64 +2623,104 @@ def _conversation_title(short_id: Optional[str], tags: List[str], fallback: str)
     return fallback
 
 
-async def _run_dataspace_tail(state: CLIState, params: Dict[str, Any], follow: bool, interval: float) -> None:
-    base_params = params.copy()
-    cursor = base_params.pop("since", None)
-    client = await _connect_client(state)
-    try:
-        while True:
-            query = base_params.copy()
-            if cursor:
-                query["since"] = cursor
+def _empty_poll_delay(interval: float, empty_polls: int) -> float:
+    """Back-off before re-polling after ``empty_polls`` consecutive empty batches."""
 
-            result = await client.call("dataspace_events", query)
-            _print_result(result, "dataspace:events")
+    backoff = min(interval * TAIL_BACKOFF_MULTIPLIER ** empty_polls, TAIL_BACKOFF_MAX)
+    jitter = TAIL_BACKOFF_JITTER * backoff
+    return max(backoff + random.uniform(-jitter, jitter), 0.0)
 
-            if not isinstance(result, dict):
-                break
 
-            next_cursor = result.get("next_cursor") or cursor
-            has_events = bool(result.get("events"))
+async def _pace_empty_poll(interval: float, empty_polls: int, elapsed: float, long_poll: float) -> None:
+    """Back off after an empty poll unless the daemon already held it for ``long_poll``.
 
-            if not follow:
-                break
+    An empty reply that took the full ``wait_ms`` paced the loop on the
+    daemon side; one that came back early sleeps (with jitter) so an idle
+    follow session cannot spin.
+    """
 
-            cursor = next_cursor
-            if not has_events:
-                continue
-    finally:
-        await client.close()
+    import asyncio
 
+    if elapsed < long_poll:
+        await asyncio.sleep(_empty_poll_delay(interval, empty_polls) - elapsed)
 
-async def _run_transcript_tail(state: CLIState, params: Dict[str, Any], follow: bool, interval: float) -> None:
-    base_params = params.copy()
-    cursor = base_params.pop("since", None)
-    client = await _connect_client(state)
-    wait_ms = max(int(interval * 1000), 0)
-    try:
-        while True:
-            query = base_params.copy()
-            if cursor:
-                query["since"] = cursor
-            if follow and wait_ms > 0:
-                query["wait_ms"] = wait_ms
 
-            result = await client.call("transcript_tail", query)
-            _print_result(result, "transcript:tail")
+async def _follow_tail(
+    client: ControlClient,
+    command: str,
+    label: str,
+    query: Dict[str, Any],
+    cursor: Optional[str],
+    follow: bool,
+    interval: float,
+) -> None:
+    """Print ``command`` batches, following ``next_cursor`` when ``follow`` is set.
 
-            if not isinstance(result, dict):
-                break
+    A single query dict is reused for the whole session; only the cursor
+    changes between polls. The request for the next batch goes out before
+    a non-empty batch is rendered, so the round trip overlaps Rich layout.
+    """
 
-            cursor = result.get("next_cursor") or cursor
-            events = result.get("events") or []
+    import asyncio
+
+    long_poll = query.get("wait_ms", 0) / 1000
+    empty_polls = 0
+    loop = asyncio.get_running_loop()
+
+    def fetch() -> asyncio.Future:
+        if cursor:
+            query["since"] = cursor
+        return asyncio.ensure_future(client.call(command, query))
 
-            if not follow:
+    started = loop.time()
+    pending: Optional[asyncio.Future] = fetch()
+    try:
+        while pending is not None:
+            result = await pending
+            pending = None
+            elapsed = loop.time() - started
+
+            if not isinstance(result, dict) or not follow:
+                _print_result(result, label)
                 break
 
-            if not events:
-                continue
+            cursor = result.get("next_cursor") or cursor
+            if result.get("events"):
+                empty_polls = 0
+                started = loop.time()
+                pending = fetch()
+                # Let the next request reach the daemon before rendering
+                # blocks the event loop.
+                await asyncio.sleep(0)
+                _print_result(result, label)
+            else:
+                empty_polls += 1
+                _print_result(result, label)
+                await _pace_empty_poll(interval, empty_polls, elapsed, long_poll)
+                started = loop.time()
+                pending = fetch()
     finally:
-        await client.close()
+        if pending is not None:
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await pending
+
+
+async def _run_dataspace_tail(state: CLIState, params: Dict[str, Any], follow: bool, interval: float) -> None:
+    query = params.copy()
+    cursor = query.pop("since", None)
+    async with _client_scope(state) as client:
+        await _follow_tail(client, "dataspace_events", "dataspace:events", query, cursor, follow, interval)
+
+
+async def _run_transcript_tail(state: CLIState, params: Dict[str, Any], follow: bool, interval: float) -> None:
+    query = params.copy()
+    cursor: Optional[str] = query.pop("since", None)
+    wait_ms = max(int(interval * 1000), 0)
+    if follow and wait_ms > 0:
+        query["wait_ms"] = wait_ms
+    async with _client_scope(state) as client:
+        await _follow_tail(client, "transcript_tail", "transcript:tail", query, cursor, follow, interval)
 
 
 async def _run_transcript_export(
@@ -2018,78 +2730,119 @@ async def _run_transcript_export(
     limit: int,
     destination: Optional[Path],
 ) -> None:
-    client = await _connect_client(state)
-    try:
+    async with _client_scope(state) as client:
         params: Dict[str, Any] = {"request_id": request_id, "limit": limit}
         if branch:
             params["branch"] = branch
         result = await client.call("transcript_show", params)
-    finally:
-        await client.close()
 
     if not isinstance(result, dict):
-        console.print(JSON.from_data(result))
+        _print_result(result, "json")
         return
 
     entries = result.get("entries") or []
     branch = branch or result.get("branch", "main")
     header = f"Transcript for {request_id} (branch {branch})"
-
-    if not entries:
-        content = header + "\n\n[No transcript entries recorded]"
-    else:
-        lines: List[str] = [header, ""]
-        for idx, entry in enumerate(entries[-limit:], start=1):
-            timestamp = entry.get("timestamp")
-            agent = entry.get("agent", "agent")
-            if timestamp:
-                lines.append(f"[{idx}] {timestamp} — {agent}")
-            else:
-                lines.append(f"[{idx}] {agent}")
-
-            prompt = entry.get("prompt", "")
-            response = entry.get("response", "")
-            if prompt:
-                lines.append(f"User: {prompt}")
-            if response:
-                lines.append(f"Assistant: {response}")
-            lines.append("")
-        content = "\n".join(lines).rstrip()
+    lines = _transcript_export_lines(header, entries[-limit:])
 
     if destination:
         destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(content, encoding="utf-8")
+        with _open_export_sink(destination) as handle:
+            # Hold back one line so only the final one is right-stripped,
+            # matching the console rendering below.
+            previous: Optional[str] = None
+            for line in lines:
+                if previous is not None:
+                    handle.write(previous)
+                    handle.write("\n")
+                previous = line
+            if previous is not None:
+                handle.write(previous.rstrip())
         console.print(
             Panel(
                 f"[green]Transcript exported to[/green] {destination}",
                 border_style="green",
             )
         )
+    elif _PLAIN_OUTPUT:
+        _write_plain_result({**result, "entries": entries[-limit:]})
     else:
         console.print(
             Panel(
-                content,
+                "\n".join(lines).rstrip(),
                 border_style="blue",
             )
         )
 
 
+def _open_export_sink(destination: Path) -> IO[str]:
+    """Open ``destination`` for UTF-8 text, compressing ``.gz`` and ``.zst`` targets."""
+
+    suffix = destination.suffix.lower()
+    if suffix == ".gz":
+        import gzip
+
+        # Exports are written once and read rarely; favour write speed.
+        return gzip.open(destination, "wt", encoding="utf-8", compresslevel=1)
+    if suffix == ".zst":
+        import io
+
+        import zstandard  # checked by transcript_export before connecting
+
+        writer = zstandard.ZstdCompressor(level=3).stream_writer(destination.open("wb"))
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return destination.open("w", encoding="utf-8")
+
+
+def _transcript_export_lines(header: str, entries: List[Dict[str, Any]]) -> Iterable[str]:
+    """Yield the plain-text export of ``entries`` one line at a time."""
+
+    yield header
+    if not entries:
+        yield ""
+        yield "[No transcript entries recorded]"
+        return
+
+    for idx, entry in enumerate(entries, start=1):
+        yield ""
+        timestamp = entry.get("timestamp")
+        agent = entry.get("agent", "agent")
+        if timestamp:
+            yield f"[{idx}] {timestamp} — {agent}"
+        else:
+            yield f"[{idx}] {agent}"
+
+        prompt = entry.get("prompt", "")
+        response = entry.get("response", "")
+        if prompt:
+            yield f"User: {prompt}"
+        if response:
+            yield f"Assistant: {response}"
+
+
 def _codebased_command(state: CLIState) -> Tuple[str, ...]:
     if state.codebased_bin:
         return (str(state.codebased_bin), "--stdio")
     env_override = os.environ.get("CODEBASED_BIN") or os.environ.get("DUETD_BIN")
     if env_override:
         return (env_override, "--stdio")
+    return (_discover_codebased_binary(), "--stdio")
+
+
+@functools.lru_cache(maxsize=None)
+def _discover_codebased_binary() -> str:
+    """Locate a locally built codebased binary, falling back to ``PATH`` lookup."""
+
     exe_name = "codebased.exe" if os.name == "nt" else "codebased"
     root = Path(__file__).resolve()
     for parent in root.parents:
         candidate = parent / "target" / "debug" / exe_name
         if candidate.exists():
-            return (str(candidate), "--stdio")
+            return str(candidate)
         candidate_release = parent / "target" / "release" / exe_name
         if candidate_release.exists():
-            return (str(candidate_release), "--stdio")
-    return (exe_name, "--stdio")
+            return str(candidate_release)
+    return exe_name
 
 
 # ---------------------------------------------------------------------------
@@ -2106,6 +2859,8 @@ def _print_status(result: Any) -> None:
     pending_inputs = result.get("pending_inputs", 0)
     snapshot_interval = result.get("snapshot_interval", 0)
 
+    from rich.tree import Tree  # status is the only tree view
+
     tree = Tree(f"[bold cyan]Branch[/bold cyan] [white]{branch}[/white]")
     tree.add(f"[dim]Head Turn:[/dim] {head_turn}")
     tree.add(f"[dim]Pending Inputs:[/dim] {pending_inputs}")
@@ -2114,6 +2869,73 @@ def _print_status(result: Any) -> None:
     console.print(Panel.fit(tree, title="[bold]Runtime Status[/bold]", border_style="cyan"))
 
 
+# Column layouts for the list printers: (header, Table.add_column kwargs).
+_ColumnSpec = Tuple[Tuple[str, Dict[str, Any]], ...]
+
+_HISTORY_COLUMNS: _ColumnSpec = (
+    ("Turn ID", {"style": "cyan", "no_wrap": True}),
+    ("Actor", {"style": "magenta", "no_wrap": True}),
+    ("Clock", {"style": "yellow", "justify": "right"}),
+    ("Inputs", {"style": "green", "justify": "right"}),
+    ("Outputs", {"style": "green", "justify": "right"}),
+    ("Timestamp", {"style": "dim"}),
+)
+
+_ENTITY_COLUMNS: _ColumnSpec = (
+    ("Entity ID", {"style": "cyan", "no_wrap": True}),
+    ("Type", {"style": "yellow"}),
+    ("Actor", {"style": "magenta", "no_wrap": True}),
+    ("Facet", {"style": "blue", "no_wrap": True}),
+    ("Patterns", {"style": "dim", "justify": "right"}),
+)
+
+_CAPABILITY_COLUMNS: _ColumnSpec = (
+    ("ID", {"style": "cyan", "no_wrap": True}),
+    ("Kind", {"style": "yellow"}),
+    ("Issuer", {"style": "green", "no_wrap": True}),
+    ("Holder", {"style": "green", "no_wrap": True}),
+    ("Status", {"style": "blue"}),
+    ("Attenuation", {"style": "dim"}),
+)
+
+_WORKSPACE_COLUMNS: _ColumnSpec = (
+    ("Path", {"style": "cyan"}),
+    ("Kind", {"style": "magenta"}),
+    ("Size", {"style": "yellow", "justify": "right"}),
+    ("Modified", {"style": "green"}),
+    ("Digest", {"style": "dim"}),
+)
+
+
+def _new_table(
+    columns: _ColumnSpec,
+    title: Optional[str],
+    border_style: str,
+    show_header: bool = True,
+) -> Table:
+    table = Table(title=title, show_header=show_header, border_style=border_style)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+def _text_cell(value: str) -> Text:
+    """Return a table cell for ``value`` with markup parsing turned off.
+
+    Ids containing ``[`` are shown verbatim, but the cell still gets the
+    console's usual highlighting (numbers, UUIDs, paths) like a str cell.
+    Each call builds a new ``Text``; cells are mutable and must not be shared.
+    """
+
+    return console.render_str(value, markup=False)
+
+
+def _add_text_rows(table: Table, rows: Iterable[Tuple[Any, ...]]) -> None:
+    add_row = table.add_row
+    for row in rows:
+        add_row(*[_text_cell(cell) if isinstance(cell, str) else cell for cell in row])
+
+
 def _print_history(result: Any) -> None:
     if not isinstance(result, dict) or "turns" not in result:
         console.print(JSON.from_data(result))
@@ -2124,26 +2946,25 @@ def _print_history(result: Any) -> None:
         console.print("[yellow]No turns recorded[/yellow]")
         return
 
-    table = Table(title="Turn History", border_style="blue")
-    table.add_column("Turn ID", style="cyan", no_wrap=True)
-    table.add_column("Actor", style="magenta", no_wrap=True)
-    table.add_column("Clock", style="yellow", justify="right")
-    table.add_column("Inputs", style="green", justify="right")
-    table.add_column("Outputs", style="green", justify="right")
-    table.add_column("Timestamp", style="dim")
-
-    for turn in turns:
-        turn_id = str(turn.get("turn_id", ""))[:16] + "..."
-        actor = str(turn.get("actor", ""))[:12] + "..."
-        clock = str(turn.get("clock", 0))
-        inputs = str(turn.get("input_count", 0))
-        outputs = str(turn.get("output_count", 0))
-        timestamp = turn.get("timestamp", "N/A")
-        table.add_row(turn_id, actor, clock, inputs, outputs, timestamp)
-
+    table = _new_table(_HISTORY_COLUMNS, "Turn History", "blue")
+    _add_text_rows(table, _history_rows(turns))
     console.print(table)
 
 
+def _history_rows(turns: List[Dict[str, Any]]) -> Iterable[Tuple[str, ...]]:
+    return (
+        (
+            _shorten(get("turn_id", ""), 16),
+            _shorten(get("actor", ""), 12),
+            str(get("clock", 0)),
+            str(get("input_count", 0)),
+            str(get("output_count", 0)),
+            get("timestamp", "N/A"),
+        )
+        for get in (turn.get for turn in turns)
+    )
+
+
 def _print_entities(result: Any) -> None:
     if not isinstance(result, dict) or "entities" not in result:
         console.print(JSON.from_data(result))
@@ -2154,21 +2975,18 @@ def _print_entities(result: Any) -> None:
         console.print("[yellow]No entities registered[/yellow]")
         return
 
-    table = Table(title="Registered Entities", border_style="green")
-    table.add_column("Entity ID", style="cyan", no_wrap=True)
-    table.add_column("Type", style="yellow")
-    table.add_column("Actor", style="magenta", no_wrap=True)
-    table.add_column("Facet", style="blue", no_wrap=True)
-    table.add_column("Patterns", style="dim", justify="right")
-
-    for entity in entities:
-        entity_id = str(entity.get("id", ""))[:12] + "..."
-        entity_type = entity.get("entity_type", entity.get("type", "N/A"))
-        actor = str(entity.get("actor", ""))[:12] + "..."
-        facet = str(entity.get("facet", ""))[:12] + "..."
-        patterns = str(entity.get("pattern_count", 0))
-        table.add_row(entity_id, entity_type, actor, facet, patterns)
-
+    table = _new_table(_ENTITY_COLUMNS, "Registered Entities", "green")
+    rows = (
+        (
+            _shorten(get("id", ""), 12),
+            get("entity_type", get("type", "N/A")),
+            _shorten(get("actor", ""), 12),
+            _shorten(get("facet", ""), 12),
+            str(get("pattern_count", 0)),
+        )
+        for get in (entity.get for entity in entities)
+    )
+    _add_text_rows(table, rows)
     console.print(table)
 
 
@@ -2182,26 +3000,22 @@ def _print_capabilities(result: Any) -> None:
         console.print("[yellow]No capabilities available[/yellow]")
         return
 
-    table = Table(title="Capabilities", border_style="magenta")
-    table.add_column("ID", style="cyan", no_wrap=True)
-    table.add_column("Kind", style="yellow")
-    table.add_column("Issuer", style="green", no_wrap=True)
-    table.add_column("Holder", style="green", no_wrap=True)
-    table.add_column("Status", style="blue")
-    table.add_column("Attenuation", style="dim")
-
-    for cap in capabilities:
-        cap_id = str(cap.get("id", ""))[:12] + "..."
-        kind = cap.get("kind", "N/A")
-        issuer = str(cap.get("issuer", ""))[:12] + "..."
-        holder = str(cap.get("holder", ""))[:12] + "..."
-        status = cap.get("status", "unknown")
-        attenuation = ", ".join(
-            value.as_string().as_ref() if hasattr(value, "as_string") else str(value)
-            for value in cap.get("attenuation", [])
+    table = _new_table(_CAPABILITY_COLUMNS, "Capabilities", "magenta")
+    rows = (
+        (
+            _shorten(get("id", ""), 12),
+            get("kind", "N/A"),
+            _shorten(get("issuer", ""), 12),
+            _shorten(get("holder", ""), 12),
+            get("status", "unknown"),
+            ", ".join(
+                value.as_string().as_ref() if hasattr(value, "as_string") else str(value)
+                for value in get("attenuation", [])
+            ),
         )
-        table.add_row(cap_id, kind, issuer, holder, status, attenuation)
-
+        for get in (cap.get for cap in capabilities)
+    )
+    _add_text_rows(table, rows)
     console.print(table)
 
 
@@ -2215,22 +3029,18 @@ def _print_workspace_entries(result: Any) -> None:
         console.print("[yellow]Workspace is empty[/yellow]")
         return
 
-    table = Table(title="Workspace Entries", border_style="green")
-    table.add_column("Path", style="cyan")
-    table.add_column("Kind", style="magenta")
-    table.add_column("Size", style="yellow", justify="right")
-    table.add_column("Modified", style="green")
-    table.add_column("Digest", style="dim")
-
-    for entry in entries:
-        table.add_row(
-            entry.get("path", ""),
-            entry.get("kind", ""),
-            str(entry.get("size", 0)),
-            entry.get("modified", "--"),
-            entry.get("digest", "--"),
+    table = _new_table(_WORKSPACE_COLUMNS, "Workspace Entries", "green")
+    rows = (
+        (
+            get("path", ""),
+            get("kind", ""),
+            str(get("size", 0)),
+            get("modified", "--"),
+            get("digest", "--"),
         )
-
+        for get in (entry.get for entry in entries)
+    )
+    _add_text_rows(table, rows)
     console.print(table)
 
 
@@ -2436,14 +3246,15 @@ def _print_agent_responses(result: Any) -> None:
 
     panels = []
     for entry in responses:
-        request_id = entry.get("request_id")
-        agent = entry.get("agent", "Agent")
-        prompt = entry.get("prompt")
-        response = entry.get("response")
-        timestamp_raw = entry.get("timestamp")
+        get = entry.get
+        request_id = get("request_id")
+        agent = get("agent", "Agent")
+        prompt = get("prompt")
+        response = get("response")
+        timestamp_raw = get("timestamp")
         formatted_timestamp = _format_timestamp(timestamp_raw)
-        role = entry.get("role")
-        tool = entry.get("tool")
+        role = get("role")
+        tool = get("tool")
         clean_prompt = _clean_user_message(prompt)
         tags = _extract_keywords([clean_prompt])
         conversation_title = _conversation_title(_short_id(request_id), tags, agent)
@@ -2483,12 +3294,13 @@ def _print_dataspace_assertions(result: Any) -> None:
 
     panels = []
     for entry in assertions:
-        actor = entry.get("actor")
-        actor_info = entry.get("actor_info") if isinstance(entry, dict) else None
-        handle = entry.get("handle")
-        summary = entry.get("summary")
-        value_structured = entry.get("value_structured")
-        value_raw = entry.get("value")
+        get = entry.get
+        actor = get("actor")
+        actor_info = get("actor_info")
+        handle = get("handle")
+        summary = get("summary")
+        value_structured = get("value_structured")
+        value_raw = get("value")
 
         actor_display = None
         entities_display = None
@@ -2548,11 +3360,12 @@ def _print_dataspace_events(result: Any) -> None:
 
     panels: List[Any] = []
     for batch in batches:
-        turn_id = batch.get("turn_id") or batch.get("turn")
-        actor = batch.get("actor")
-        actor_info = batch.get("actor_info") if isinstance(batch, dict) else None
-        clock = batch.get("clock")
-        timestamp = batch.get("timestamp")
+        batch_get = batch.get
+        turn_id = batch_get("turn_id") or batch_get("turn")
+        actor = batch_get("actor")
+        actor_info = batch_get("actor_info")
+        clock = batch_get("clock")
+        timestamp = batch_get("timestamp")
         formatted_batch_timestamp = _format_timestamp(timestamp)
 
         actor_display = None
@@ -2584,19 +3397,21 @@ def _print_dataspace_events(result: Any) -> None:
         metadata = _metadata_block(metadata_pairs)
         entry_renderables: List[Any] = [metadata] if metadata is not None else []
 
-        for event in batch.get("events", []):
-            action = (event.get("action") or "").upper()
-            handle = event.get("handle")
-            transcript = event.get("transcript")
+        for event in batch_get("events", ()):
+            get = event.get
+            action = (get("action") or "").upper()
+            handle = get("handle")
+            transcript = get("transcript")
 
             if isinstance(transcript, dict):
-                request_id = transcript.get("request_id")
-                agent_name = transcript.get("agent", "Agent")
-                response_timestamp_raw = transcript.get("response_timestamp")
-                role = transcript.get("role")
-                tool = transcript.get("tool")
-                prompt_text = transcript.get("prompt")
-                response_text = transcript.get("response")
+                transcript_get = transcript.get
+                request_id = transcript_get("request_id")
+                agent_name = transcript_get("agent", "Agent")
+                response_timestamp_raw = transcript_get("response_timestamp")
+                role = transcript_get("role")
+                tool = transcript_get("tool")
+                prompt_text = transcript_get("prompt")
+                response_text = transcript_get("response")
                 formatted_response_timestamp = _format_timestamp(response_timestamp_raw)
                 clean_prompt = _clean_user_message(prompt_text)
                 tags = _extract_keywords([clean_prompt])
@@ -2628,9 +3443,9 @@ def _print_dataspace_events(result: Any) -> None:
                     )
                 )
             else:
-                value_structured = event.get("value_structured")
-                summary_text = event.get("summary")
-                value_raw = event.get("value")
+                value_structured = get("value_structured")
+                summary_text = get("summary")
+                value_raw = get("value")
                 metadata_pairs = [
                     ("Action", action),
                     ("Handle", _short_id(handle)),
@@ -2696,16 +3511,17 @@ def _print_transcript_show(result: Any) -> None:
 
     panels: List[Any] = []
     for idx, entry in enumerate(entries, start=1):
-        agent = entry.get("agent", "Agent")
-        actor = entry.get("actor")
-        handle = entry.get("handle")
-        timestamp_raw = entry.get("timestamp")
+        get = entry.get
+        agent = get("agent", "Agent")
+        actor = get("actor")
+        handle = get("handle")
+        timestamp_raw = get("timestamp")
         formatted_timestamp = _format_timestamp(timestamp_raw)
-        role = entry.get("role")
-        tool = entry.get("tool")
-        prompt = entry.get("prompt")
-        response = entry.get("response")
-        request_for_entry = entry.get("request_id") or request_id
+        role = get("role")
+        tool = get("tool")
+        prompt = get("prompt")
+        response = get("response")
+        request_for_entry = get("request_id") or request_id
 
         role_meta = role if role and role.lower() not in {"assistant", "agent"} else None
         metadata = [
@@ -2749,10 +3565,11 @@ def _print_transcript_tail(result: Any) -> None:
         return
     panels: List[Any] = []
     for batch in events:
-        turn_id = batch.get("turn") or batch.get("turn_id")
-        actor = batch.get("actor")
-        clock = batch.get("clock")
-        timestamp_raw = batch.get("timestamp")
+        batch_get = batch.get
+        turn_id = batch_get("turn") or batch_get("turn_id")
+        actor = batch_get("actor")
+        clock = batch_get("clock")
+        timestamp_raw = batch_get("timestamp")
         formatted_batch_timestamp = _format_timestamp(timestamp_raw)
         timestamp_display = formatted_batch_timestamp or timestamp_raw or "-"
 
@@ -2765,19 +3582,21 @@ def _print_transcript_tail(result: Any) -> None:
 
         batch_renderables: List[Any] = [Group(*header_lines)]
 
-        for event in batch.get("events", []):
-            action = (event.get("action") or "").upper()
-            handle = event.get("handle")
-            transcript = event.get("transcript")
+        for event in batch_get("events", ()):
+            get = event.get
+            action = (get("action") or "").upper()
+            handle = get("handle")
+            transcript = get("transcript")
 
             if isinstance(transcript, dict):
-                request_id = transcript.get("request_id")
-                agent_name = transcript.get("agent", "Agent")
-                role = transcript.get("role")
-                tool = transcript.get("tool")
-                prompt_text = transcript.get("prompt")
-                response_text = transcript.get("response")
-                response_timestamp_raw = transcript.get("response_timestamp")
+                transcript_get = transcript.get
+                request_id = transcript_get("request_id")
+                agent_name = transcript_get("agent", "Agent")
+                role = transcript_get("role")
+                tool = transcript_get("tool")
+                prompt_text = transcript_get("prompt")
+                response_text = transcript_get("response")
+                response_timestamp_raw = transcript_get("response_timestamp")
                 formatted_response_timestamp = _format_timestamp(response_timestamp_raw)
 
                 role_meta = role if role and role.lower() not in {"assistant", "agent"} else None
@@ -2809,7 +3628,7 @@ def _print_transcript_tail(result: Any) -> None:
                 )
                 batch_renderables.append(exchange)
             else:
-                value = event.get("value")
+                value = get("value")
                 summary = f"[bold]{action}[/bold] {_short_id(handle) or ''}"
                 if value:
                     summary += f"\n{_summarize_value(value, max_length=200)}"
@@ -2821,9 +3640,6 @@ def _print_transcript_tail(result: Any) -> None:
             body = Group(*batch_renderables) if len(batch_renderables) > 1 else batch_renderables[0]
             panels.append(Panel(body, border_style="blue", box=box.ROUNDED))
 
-    if panels:
-        console.print(Group(*panels) if len(panels) > 1 else panels[0])
-
     next_cursor = result.get("next_cursor")
     has_more = result.get("has_more")
     if next_cursor or has_more:
@@ -2832,8 +3648,12 @@ def _print_transcript_tail(result: Any) -> None:
             footer_parts.append(f"next cursor: {next_cursor}")
         if has_more:
             footer_parts.append("more events available")
-        console.print(f"[dim]{' | '.join(footer_parts)}[/dim]")
+        # Plain Text: the cursor is opaque server data, so skip markup parsing.
+        panels.append(Text(" | ".join(footer_parts), style="dim"))
 
+    # One print per poll keeps follow sessions to a single terminal write.
+    if panels:
+        console.print(Group(*panels) if len(panels) > 1 else panels[0])
 
 
 def _print_workflow_list(result: Any) -> None:
@@ -3031,9 +3851,10 @@ def _print_reaction_list(result: Any) -> None:
 
     panels = []
     for entry in reactions:
-        reaction_id = entry.get("reaction_id", "")
-        actor = entry.get("actor", "")
-        definition = entry.get("definition", {})
+        get = entry.get
+        reaction_id = get("reaction_id", "")
+        actor = get("actor", "")
+        definition = get("definition", {})
         pattern = definition.get("pattern", {})
         effect = definition.get("effect", {})
 
@@ -3068,7 +3889,7 @@ def _print_reaction_list(result: Any) -> None:
                     )
                 else:
                     sections.append(
-                        "[bold]Effect[/bold]\n" + json.dumps(value_info, indent=2)
+                        "[bold]Effect[/bold]\n" + _json.dumps_pretty(value_info)
                     )
             if effect.get("target_facet"):
                 sections.append(
@@ -3098,12 +3919,12 @@ def _print_reaction_list(result: Any) -> None:
                     )
                 else:
                     sections.append(
-                        "[bold]Payload[/bold]\n" + json.dumps(payload_info, indent=2)
+                        "[bold]Payload[/bold]\n" + _json.dumps_pretty(payload_info)
                     )
             else:
                 sections.append(f"[bold]Payload[/bold]\n{payload_info}")
         else:
-            sections.append("[bold]Effect[/bold]\n" + json.dumps(effect, indent=2))
+            sections.append("[bold]Effect[/bold]\n" + _json.dumps_pretty(effect))
 
         stats = entry.get("stats", {})
         if isinstance(stats, dict):
@@ -3125,6 +3946,32 @@ def _print_reaction_list(result: Any) -> None:
     console.print(Group(*panels) if len(panels) > 1 else panels[0])
 
 
+_MEMO_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _memoize_hashable(maxsize: int) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Memoize a pure formatter on scalar arguments; other values bypass the cache.
+
+    ``typed=True`` only distinguishes top-level argument types, so hashable
+    containers such as ``(1,)`` and ``(True,)`` would share an entry.
+    """
+
+    def decorator(func: Callable[..., str]) -> Callable[..., str]:
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(func)
+
+        @functools.wraps(func)
+        def wrapper(value: Any, *args: Any, **kwargs: Any) -> str:
+            if type(value) in _MEMO_SCALAR_TYPES:
+                return cached(value, *args, **kwargs)
+            return func(value, *args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+@_memoize_hashable(maxsize=8192)
 def _format_uuidish(value: Any, length: int = 12) -> str:
     if isinstance(value, str):
         text = value
@@ -3134,25 +3981,61 @@ def _format_uuidish(value: Any, length: int = 12) -> str:
         elif "uuid" in value:
             text = str(value["uuid"])
         else:
-            text = json.dumps(value, ensure_ascii=False)
+            text = _json_object_prefix(value, length)
     else:
         text = str(value)
 
-    if len(text) > length:
-        return f"{text[:length]}..."
-    return text
+    if len(text) <= length:
+        return text
+    return text[:length] + "..."
+
+
+def _json_object_prefix(value: Dict[Any, Any], length: int) -> str:
+    """Compact JSON for ``value``, encoded only far enough to exceed ``length``.
 
+    Callers truncate the result, so members past the cut-off are never
+    serialized; the visible prefix matches ``_json.dumps(value)``.
+    """
 
+    parts = ["{"]
+    size = 1
+    for key, item in value.items():
+        if not isinstance(key, str):
+            return _json.dumps(value)
+        if size > 1:
+            parts.append(",")
+            size += 1
+        member = f"{_json.dumps(key)}:{_json.dumps(item)}"
+        parts.append(member)
+        size += len(member)
+        if size > length:
+            return "".join(parts)
+    parts.append("}")
+    return "".join(parts)
+
+
+@_memoize_hashable(maxsize=4096)
 def _summarize_value(value: Any, max_length: int = 80) -> str:
+    # Primitives are formatted directly; only containers and values needing
+    # escapes go through the JSON encoder.
     if value is None:
         return "null"
-    try:
-        text = json.dumps(value, ensure_ascii=False)
-    except TypeError:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
         text = str(value)
-    if len(text) > max_length:
-        return f"{text[: max_length - 3]}..."
-    return text
+    elif type(value) is str and '"' not in value and "\\" not in value and value.isprintable():
+        text = '"' + value + '"'
+    else:
+        try:
+            text = _json.dumps(value)
+        except TypeError:
+            text = str(value)
+    if len(text) <= max_length:
+        return text
+    return text[: max_length - 3] + "..."
 
 
 def _structured_value_metadata(structured: Any) -> List[Tuple[str, Optional[str]]]:
@@ -3330,9 +4213,41 @@ def _instance_binding_lines(instance: Any) -> List[str]:
     return lines
 
 
+_JSON_HIGHLIGHTER = JSONHighlighter()
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_json_renderable(payload: bytes) -> Text:
+    # Equivalent to rich.json.JSON, but indents with the _json codec and
+    # shares one highlighter instead of building a new one per render.
+    text = _JSON_HIGHLIGHTER(_json.dumps_pretty(_json.loads(payload)))
+    text.no_wrap = True
+    text.overflow = None
+    return text
+
+
+def _json_renderable(value: Any) -> Union[JSON, Text]:
+    """Highlighted JSON for ``value``, reused when an identical payload repeats."""
+
+    try:
+        payload = _json.dumps_bytes(value)
+    except (TypeError, ValueError):
+        return JSON.from_data(value)
+    return _cached_json_renderable(payload)
+
+
+# Panel copies Text titles before styling them, so these can be shared.
+_SUCCESS_TITLE = Text("Success", style="bold green")
+
+
+@functools.lru_cache(maxsize=None)
+def _navigation_title(operation: str) -> Text:
+    return Text(operation.title(), style="bold cyan")
+
+
 def _print_operation_result(result: Any, operation: str) -> None:
     if isinstance(result, dict):
-        title = "[bold green]Success[/bold green]"
+        title = _SUCCESS_TITLE
         subtitle = ""
         if "queued_turn" in result:
             subtitle = f"Queued turn {result['queued_turn']}"
@@ -3341,7 +4256,7 @@ def _print_operation_result(result: Any, operation: str) -> None:
 
         console.print(
             Panel(
-                JSON.from_data(result),
+                _json_renderable(result),
                 title=title,
                 subtitle=subtitle,
                 border_style="green",
@@ -3355,70 +4270,97 @@ def _print_navigation_result(result: Any, operation: str) -> None:
     if isinstance(result, dict):
         console.print(
             Panel(
-                JSON.from_data(result),
-                title=f"[bold cyan]{operation.title()}[/bold cyan]",
+                _json_renderable(result),
+                title=_navigation_title(operation),
                 border_style="cyan",
             )
         )
     else:
-        console.print(f"[green]{result}[/green]")
+        # Console.out writes the styled line without markup parsing or
+        # wrapping; the result is a short scalar here.
+        console.out(result, style="green", highlight=False)
 
 
 def _print_workspace_write(result: Any) -> None:
     _print_operation_result(result, "workspace:write")
 
 
+def _write_plain_result(result: Any) -> None:
+    data = _json.dumps_bytes(result) + b"\n"
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode("utf-8"))
+        stream.flush()
+        return
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _write_plain_error(message: str) -> None:
+    sys.stderr.write(f"duet: {message}\n")
+    sys.stderr.flush()
+
+
+def _print_json_result(result: Any) -> None:
+    console.print(_json_renderable(result))
+
+
+_RESULT_PRINTERS: Dict[str, Callable[[Any], None]] = {
+    "status": _print_status,
+    "history": _print_history,
+    "list-entities": _print_entities,
+    "list-capabilities": _print_capabilities,
+    **{
+        command: functools.partial(_print_navigation_result, operation=command)
+        for command in ("goto", "back", "fork", "merge")
+    },
+    **{
+        command: functools.partial(_print_operation_result, operation=command)
+        for command in ("send", "invoke-capability", "workspace:scan", "workspace:write", "raw")
+    },
+    "workspace:entries": _print_workspace_entries,
+    "workspace:read": _print_workspace_read,
+    "agent:invoke": _print_agent_invoke,
+    "agent:responses": _print_agent_responses,
+    "agent:requests": _print_agent_requests,
+    "dataspace:assertions": _print_dataspace_assertions,
+    "dataspace:events": _print_dataspace_events,
+    "transcript:show": _print_transcript_show,
+    "transcript:tail": _print_transcript_tail,
+    "workflow:list": _print_workflow_list,
+    "workflow:start": _print_workflow_start,
+    "reaction:register": _print_reaction_register,
+    "reaction:unregister": _print_reaction_unregister,
+    "reaction:list": _print_reaction_list,
+    "json": _print_json_result,
+}
+
+
 def _print_result(result: Any, command: str) -> None:
-    if command == "status":
-        _print_status(result)
-    elif command == "history":
-        _print_history(result)
-    elif command == "list-entities":
-        _print_entities(result)
-    elif command == "list-capabilities":
-        _print_capabilities(result)
-    elif command in ("goto", "back", "fork", "merge"):
-        _print_navigation_result(result, command)
-    elif command in ("send", "invoke-capability", "workspace:scan", "workspace:write", "raw"):
-        _print_operation_result(result, command)
-    elif command == "workspace:entries":
-        _print_workspace_entries(result)
-    elif command == "workspace:read":
-        _print_workspace_read(result)
-    elif command == "agent:invoke":
-        _print_agent_invoke(result)
-    elif command == "agent:responses":
-        _print_agent_responses(result)
-    elif command == "dataspace:assertions":
-        _print_dataspace_assertions(result)
-    elif command == "dataspace:events":
-        _print_dataspace_events(result)
-    elif command == "transcript:show":
-        _print_transcript_show(result)
-    elif command == "transcript:tail":
-        _print_transcript_tail(result)
-    elif command == "workflow:list":
-        _print_workflow_list(result)
-    elif command == "workflow:start":
-        _print_workflow_start(result)
-    elif command == "reaction:register":
-        _print_reaction_register(result)
-    elif command == "reaction:unregister":
-        _print_reaction_unregister(result)
-    elif command == "reaction:list":
-        _print_reaction_list(result)
-    else:
-        console.print(JSON.from_data(result))
+    if _PLAIN_OUTPUT:
+        _write_plain_result(result)
+        return
+    _RESULT_PRINTERS.get(command, _print_json_result)(result)
 
 
 def _print_protocol_error(exc: ProtocolError) -> None:
-    suffix = f" ({exc.code})" if getattr(exc, "code", None) else ""
-    details = getattr(exc, "details", None)
+    code = exc.code
+    details = exc.details
+    suffix = f" ({code})" if code else ""
+
+    if _PLAIN_OUTPUT:
+        if details is not None:
+            _write_plain_error(f"protocol error{suffix}: {exc} {_json.dumps(details)}")
+        else:
+            _write_plain_error(f"protocol error{suffix}: {exc}")
+        return
 
     content = f"[bold]{exc}[/bold]"
     if details is not None:
         if isinstance(details, (dict, list)):
-            content += f"\n\n[dim]Details:[/dim]\n{json.dumps(details, indent=2)}"
+            content += f"\n\n[dim]Details:[/dim]\n{_json.dumps_pretty(details)}"
         else:
             content += f"\n\n[dim]Details:[/dim] {details}"
 
@@ -3432,6 +4374,9 @@ def _print_protocol_error(exc: ProtocolError) -> None:
 
 
 def _print_launch_error(exc: FileNotFoundError) -> None:
+    if _PLAIN_OUTPUT:
+        _write_plain_error(f"failed to launch: {exc}")
+        return
     console.print(
         Panel(
             f"[bold]{exc}[/bold]\n\n[dim]Ensure codebased is installed or specify --codebased-bin.[/dim]",
@@ -3442,10 +4387,19 @@ def _print_launch_error(exc: FileNotFoundError) -> None:
 
 
 def _print_unexpected_error(exc: Exception) -> None:
-    tb = traceback.format_exc()
+    if _PLAIN_OUTPUT:
+        _write_plain_error(f"unexpected error: {exc!r}")
+        return
+    # Imported lazily: the traceback renderer pulls in pygments via
+    # rich.syntax, which only the error path needs.
+    from rich.traceback import Traceback
+
+    tb = Traceback.from_exception(
+        type(exc), exc, exc.__traceback__, show_locals=False, max_frames=20
+    )
     console.print(
         Panel(
-            f"[bold]{exc}[/bold]\n\n[dim]{tb}[/dim]",
+            Group(Text(str(exc), style="bold"), Text(), tb),
             title="[bold red]Unexpected Error[/bold red]",
             border_style="red",
         )
@@ -3512,11 +4466,20 @@ def transcript_export(
         None,
         "--output",
         "-o",
-        help="Write transcript to this file instead of stdout.",
+        help="Write transcript to this file instead of stdout (.gz and .zst are compressed).",
     ),
 ) -> None:
     """Export transcript history as plain text."""
 
+    if (
+        output is not None
+        and output.suffix.lower() == ".zst"
+        and importlib.util.find_spec("zstandard") is None
+    ):
+        raise typer.BadParameter(
+            "writing .zst exports requires the zstandard package (pip install 'duet[zstd]')",
+            param_hint="--output",
+        )
     if request_id is None:
         request_id = _choose_request_id(ctx.obj, title="Select transcript request")
         if request_id is None:
@@ -3564,7 +4527,14 @@ def workflow_start(
     ),
 ) -> None:
     """Start a workflow using the provided definition file."""
-    definition_text = definition.read_text(encoding="utf-8")
+    # Read before connecting so a bad file is reported as such, not as a
+    # daemon launch failure.
+    try:
+        definition_text = definition.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        raise typer.BadParameter(
+            f"cannot read workflow definition {definition}: {exc}", param_hint="DEFINITION"
+        ) from None
     params: Dict[str, Any] = {
         "definition": definition_text,
         "definition_path": str(definition),
@@ -3578,5 +4548,16 @@ def main_entrypoint() -> None:
     app()
 
 
+def main_plain_entrypoint() -> None:
+    """Entry point for ``duet-plain``: the CLI with plain JSON output forced on."""
+
+    global _PLAIN_FORCED
+    _PLAIN_FORCED = True
+    try:
+        app()
+    finally:
+        _PLAIN_FORCED = False
+
+
 if __name__ == "__main__":  # pragma: no cover - manual invocation
     main_entrypoint()
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
-import json
 from itertools import count
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+
+from .. import _json
 
 PROTOCOL_VERSION = "1.0.0"
 
+# Responses arrive as one NDJSON line each, and transcript or history
+# payloads routinely exceed asyncio's 64 KiB default line limit.
+STREAM_LIMIT = 16 * 1024 * 1024
+
 
 class ProtocolError(RuntimeError):
     """Raised when the runtime reports a protocol-level error."""
@@ -37,12 +44,24 @@ class ControlClient:
         self._writer: asyncio.StreamWriter | None = None
         self._counter = count(1)
 
+    @property
+    def runtime_addr(self) -> Optional[Tuple[str, int]]:
+        """The daemon address for TCP clients, or ``None`` for a stdio runtime."""
+
+        return self._runtime_addr
+
     async def connect(self) -> None:
+        # Imported here so loading the module (e.g. for ProtocolError) does
+        # not pull in asyncio.
+        import asyncio
+
         if self._reader is not None:
             return
 
         if self._runtime_addr is not None:
-            reader, writer = await asyncio.open_connection(*self._runtime_addr)
+            reader, writer = await asyncio.open_connection(
+                *self._runtime_addr, limit=STREAM_LIMIT
+            )
             self._reader = reader
             self._writer = writer
         else:
@@ -51,6 +70,7 @@ class ControlClient:
                 *self._runtime_cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
+                limit=STREAM_LIMIT,
             )
             self._reader = self._process.stdout
             self._writer = self._process.stdin
@@ -129,7 +149,7 @@ class ControlClient:
             "params": params,
         }
 
-        data = (json.dumps(envelope) + "\n").encode("utf-8")
+        data = _json.dumps_bytes(envelope) + b"\n"
         self._writer.write(data)
         await self._writer.drain()
 
@@ -137,7 +157,7 @@ class ControlClient:
         if not line:
             raise RuntimeError("codebased closed the connection")
 
-        response = json.loads(line.decode("utf-8"))
+        response = _json.loads(line)
         if "error" in response:
             error = response["error"]
             message = error.get("message", "unknown error")
@@ -0,0 +1,218 @@
+import gzip
+import importlib.util
+import os
+import socket
+import sys
+import tempfile
+import textwrap
+import threading
+import unittest
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+from typer.testing import CliRunner
+
+from duet import _json, cli
+from duet.cli import _await_daemon, _open_export_sink
+
+
+FAKE_CODEBASED = textwrap.dedent(
+    """\
+    import json, os, socket, sys
+    args = sys.argv[1:]
+    if "--listen-fd" in args:
+        if os.environ.get("FAKE_NO_LISTEN_FD"):
+            print("Unknown argument: --listen-fd", file=sys.stderr)
+            sys.exit(2)
+        server = socket.socket(fileno=int(args[args.index("--listen-fd") + 1]))
+    else:
+        host, port = args[args.index("--listen") + 1].rsplit(":", 1)
+        server = socket.create_server((host, int(port)))
+    print("serving", " ".join(args), flush=True)
+    while True:
+        conn, _ = server.accept()
+        with conn, conn.makefile("rwb") as stream:
+            for line in stream:
+                request = json.loads(line)
+                stream.write(json.dumps({"id": request["id"], "result": {}}).encode() + b"\\n")
+                stream.flush()
+    """
+)
+
+
+class _OneShotServer:
+    """Accept connections and answer every handshake with ``reply``."""
+
+    def __init__(self, reply: bytes) -> None:
+        self.reply = reply
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn:
+                conn.recv(4096)
+                conn.sendall(self.reply)
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class AwaitDaemonTests(unittest.TestCase):
+    def _await(self, reply: bytes, timeout: float = 0.5) -> Optional[Exception]:
+        server = _OneShotServer(reply)
+        self.addCleanup(server.close)
+        try:
+            _await_daemon("127.0.0.1", server.port, timeout=timeout)
+        except RuntimeError as exc:
+            return exc
+        return None
+
+    def test_handshake_reply_means_ready(self) -> None:
+        self.assertIsNone(self._await(b'{"id":0,"result":{}}\n'))
+
+    def test_handshake_error_is_reported(self) -> None:
+        exc = self._await(b'{"id":0,"error":{"message":"unsupported protocol version"}}\n')
+        self.assertIn("rejected handshake", str(exc))
+
+    def test_malformed_reply_is_a_failed_probe(self) -> None:
+        exc = self._await(b"HTTP/1.1 400 Bad Request\r\n\r\n", timeout=0.3)
+        self.assertIn("did not become ready", str(exc))
+
+
+@unittest.skipUnless(os.name == "posix", "descriptor handoff is POSIX-only")
+class DaemonStartTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name) / "root"
+        self.root.mkdir()
+        self.binary = Path(tmp.name) / "codebased"
+        self.binary.write_text(f"#!{sys.executable}\n{FAKE_CODEBASED}")
+        self.binary.chmod(0o755)
+
+    def _invoke(self, *args: str, env: Optional[dict] = None):
+        base = ["--root", str(self.root), "--codebased-bin", str(self.binary), "--no-plain"]
+        return CliRunner().invoke(cli.app, [*base, *args], env=env)
+
+    def _start(self, env: Optional[dict] = None) -> str:
+        result = self._invoke("codebased", "start", env=env)
+        self.addCleanup(self._invoke, "codebased", "stop")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Daemon listening on", result.output)
+        return (self.root / cli.DAEMON_LOG_FILE).read_text()
+
+    def test_start_hands_the_bound_socket_to_the_daemon(self) -> None:
+        self.assertIn("--listen-fd", self._start())
+
+    def test_start_falls_back_to_listen_address(self) -> None:
+        log = self._start(env={"FAKE_NO_LISTEN_FD": "1"})
+        self.assertIn("Unknown argument: --listen-fd", log)
+        self.assertIn("serving", log)
+        self.assertIn("--listen 127.0.0.1:", log)
+
+
+class ExportSinkTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def _write(self, name: str) -> Path:
+        path = self.dir / name
+        with _open_export_sink(path) as sink:
+            sink.write("Transcript — request\nUser: hi\n")
+        return path
+
+    def test_gzip_export_round_trips(self) -> None:
+        path = self._write("out.txt.gz")
+        with gzip.open(path, "rt", encoding="utf-8") as stream:
+            self.assertEqual(stream.read(), "Transcript — request\nUser: hi\n")
+
+    @unittest.skipIf(importlib.util.find_spec("zstandard") is None, "zstandard not installed")
+    def test_zstd_export_round_trips(self) -> None:
+        import zstandard
+
+        path = self._write("out.txt.zst")
+        with zstandard.open(path, "rt", encoding="utf-8") as stream:
+            self.assertEqual(stream.read(), "Transcript — request\nUser: hi\n")
+
+    def test_zstd_export_without_extra_is_a_usage_error(self) -> None:
+        target = self.dir / "out.txt.zst"
+        with mock.patch.object(cli.importlib.util, "find_spec", return_value=None):
+            result = CliRunner().invoke(
+                cli.app, ["--no-plain", "debug", "transcript-export", "req-1", "-o", str(target)]
+            )
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("zstandard", result.output)
+        self.assertFalse(target.exists())
+
+
+class RawBatchTests(unittest.TestCase):
+    BATCH = '{"command": "status"}\n\n{"command": "history", "params": {"limit": 2}}\n'
+
+    def setUp(self) -> None:
+        self.calls = []
+        calls = self.calls
+
+        class Client:
+            runtime_addr = ("127.0.0.1", 4000)
+
+            async def call(self, command, params):
+                calls.append((command, params))
+                return {"command": command, "params": params}
+
+            async def close(self) -> None:
+                pass
+
+        async def connect(state):
+            return Client()
+
+        patcher = mock.patch.object(cli, "_connect_client", connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _invoke(self, *args: str, input: str):
+        return CliRunner().invoke(cli.app, [*args, "debug", "raw-batch"], input=input)
+
+    def test_plain_mode_writes_one_json_line_per_command(self) -> None:
+        result = self._invoke("--plain", input=self.BATCH)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.calls, [("status", {}), ("history", {"limit": 2})])
+        self.assertEqual(
+            [_json.loads(line) for line in result.stdout.splitlines()],
+            [
+                {"command": "status", "params": {}},
+                {"command": "history", "params": {"limit": 2}},
+            ],
+        )
+
+    def test_rich_mode_renders_each_result(self) -> None:
+        result = self._invoke("--no-plain", input=self.BATCH)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(result.stdout.count("Success"), 2)
+        with self.assertRaises(ValueError):
+            _json.loads(result.stdout.splitlines()[0])
+
+    def test_malformed_line_is_rejected_before_sending(self) -> None:
+        result = self._invoke("--no-plain", input='{"command": "status"}\n{"command": \n')
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("line 2", result.output)
+        self.assertEqual(self.calls, [])
+
+        result = self._invoke("--no-plain", input='{"command": "status", "params": []}\n')
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("line 1", result.output)
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,28 @@
 import os
 import time
 import unittest
+from pathlib import Path
+from unittest import mock
 
+from typer.testing import CliRunner
+
+from duet import _json, cli
 from duet.cli import (
+    CLIState,
     _clean_assistant_message,
     _clean_user_message,
+    _codebased_command,
+    _discover_codebased_binary,
+    _empty_poll_delay,
     _extract_keywords,
     _format_timestamp,
+    _format_uuidish,
+    _print_entities,
+    _shorten,
     _structured_value_metadata,
     _structured_value_renderable,
+    _summarize_value,
+    _text_cell,
 )
 
 
@@ -104,6 +118,246 @@ class CliHelperTests(unittest.TestCase):
         renderable = _structured_value_renderable(structured)
         self.assertIsNotNone(renderable)
 
+    def test_empty_poll_delay_backs_off_to_cap(self) -> None:
+        first = _empty_poll_delay(1.0, 1)
+        self.assertGreaterEqual(first, 1.35)
+        self.assertLessEqual(first, 1.65)
+        self.assertLessEqual(_empty_poll_delay(1.0, 50), 5.5)
+
+    def test_shorten_truncates_and_appends_suffix(self) -> None:
+        self.assertEqual(_shorten("abcdefghijklmnop", 4), "abcd...")
+        self.assertEqual(_shorten(12345, 3, suffix=""), "123")
+        self.assertEqual(_shorten("turn_0", 16), "turn_0")
+
+    def test_format_uuidish_previews_dict_prefix(self) -> None:
+        value = {"actor": "a" * 40, "facet": "f"}
+        self.assertEqual(_format_uuidish(value), '{"actor":"aa...')
+        self.assertEqual(_format_uuidish({"a": 1}), '{"a":1}')
+        self.assertEqual(_format_uuidish({"uuid": "1234"}), "1234")
+
+    def test_codebased_command_prefers_explicit_binary(self) -> None:
+        state = CLIState(root=None, codebased_bin=Path("/opt/cb"), daemon_host=None, daemon_port=None)
+        env = {"CODEBASED_BIN": "/env/cb"}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(_codebased_command(state), ("/opt/cb", "--stdio"))
+            state = CLIState(root=None, codebased_bin=None, daemon_host=None, daemon_port=None)
+            self.assertEqual(_codebased_command(state), ("/env/cb", "--stdio"))
+
+        _discover_codebased_binary.cache_clear()
+        with mock.patch.dict(os.environ):
+            os.environ.pop("CODEBASED_BIN", None)
+            os.environ.pop("DUETD_BIN", None)
+            discovered = _codebased_command(state)
+            self.assertEqual(_codebased_command(state), discovered)
+        self.assertEqual(discovered[1], "--stdio")
+        info = _discover_codebased_binary.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_summarize_value_keeps_equal_values_of_different_types_apart(self) -> None:
+        self.assertEqual(_summarize_value(1), "1")
+        self.assertEqual(_summarize_value(True), "true")
+        self.assertEqual(_summarize_value(1.0), "1.0")
+        self.assertEqual(_summarize_value((1,)), "[1]")
+        self.assertEqual(_summarize_value((True,)), "[true]")
+
+    def test_summarize_value_matches_compact_encoder(self) -> None:
+        for value in ("plain", "caf\u00e9", 'say "hi"', "a\\b", "tab\t", 42, -7, 2.5):
+            self.assertEqual(_summarize_value(value), _json.dumps(value))
+        self.assertEqual(_summarize_value({"a": 1, "b": [1, 2]}), '{"a":1,"b":[1,2]}')
+
+    def test_print_entities_renders_one_table_past_500_rows(self) -> None:
+        entities = [{"id": f"e{i}", "entity_type": "t", "actor": "a", "facet": "f"} for i in range(502)]
+        entities[-1]["entity_type"] = "a-much-wider-entity-type"
+        with cli.console.capture() as capture:
+            _print_entities({"entities": entities})
+        output = capture.get()
+        self.assertEqual(output.count("Registered Entities"), 1)
+        self.assertEqual(len({len(line) for line in output.splitlines()[1:] if line.strip()}), 1)
+
+    def test_plain_mode_is_computed_per_invocation(self) -> None:
+        seen = []
+        runner = CliRunner()
+
+        def record(ctx: object) -> None:
+            seen.append((cli._PLAIN_OUTPUT, cli.console.stderr))
+
+        with mock.patch.object(cli, "_show_group_help", record):
+            runner.invoke(cli.app, ["--plain"])
+            runner.invoke(cli.app, ["--no-plain"])
+            with mock.patch.object(cli, "_PLAIN_FORCED", True):
+                runner.invoke(cli.app, ["--no-plain"])
+        self.assertEqual(seen, [(True, True), (False, False), (True, True)])
+        self.assertFalse(cli._PLAIN_OUTPUT)
+        self.assertFalse(cli.console.stderr)
+    def test_text_cell_is_fresh_highlighted_and_markup_free(self) -> None:
+        first, second = _text_cell("[id] 42"), _text_cell("[id] 42")
+        self.assertIsNot(first, second)
+        self.assertEqual(first.plain, "[id] 42")
+        self.assertTrue(first.spans)
+        first.stylize("bold")
+        self.assertNotEqual(first.spans, second.spans)
+
+
+class _FakeClient:
+    def __init__(self, runtime_addr):
+        self.runtime_addr = runtime_addr
+        self.closed = 0
+
+    async def close(self) -> None:
+        self.closed += 1
+
+
+class ClientScopeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = CLIState(root=None, codebased_bin=None, daemon_host=None, daemon_port=None)
+        self.clients = []
+        self.at_exit = []
+
+        async def connect(state):
+            client = _FakeClient(self.runtime_addr)
+            self.clients.append(client)
+            return client
+
+        for patcher in (
+            mock.patch.object(cli, "_connect_client", connect),
+            mock.patch.object(cli.atexit, "register", lambda *args: self.at_exit.append(args)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _nested(self, error=None):
+        async def scenario():
+            async with cli._client_scope(self.state) as outer:
+                async with cli._client_scope(self.state) as inner:
+                    self.assertIs(inner, outer)
+                    if error is not None:
+                        raise error
+                self.assertEqual(outer.closed, 0)
+
+        cli._run_coroutine(scenario())
+
+    def test_tcp_client_closes_when_outermost_scope_exits(self) -> None:
+        self.runtime_addr = ("127.0.0.1", 4000)
+        self._nested()
+        self._nested()
+        self.assertEqual([client.closed for client in self.clients], [1, 1])
+        self.assertIsNone(self.state.client)
+        self.assertEqual(self.at_exit, [])
+
+    def test_stdio_client_is_kept_until_exit_hook(self) -> None:
+        self.runtime_addr = None
+        self._nested()
+        self._nested()
+        self.assertEqual(len(self.clients), 1)
+        self.assertEqual(self.clients[0].closed, 0)
+        self.assertEqual(self.at_exit, [(cli._close_shared_client, self.state)])
+        cli._close_shared_client(self.state)
+        self.assertEqual(self.clients[0].closed, 1)
+        self.assertIsNone(self.state.client)
+
+    def test_failure_closes_kept_client_but_daemon_errors_do_not(self) -> None:
+        self.runtime_addr = None
+        with self.assertRaises(cli.ProtocolError):
+            self._nested(cli.ProtocolError("rejected"))
+        self.assertEqual(self.clients[0].closed, 0)
+        with self.assertRaises(RuntimeError):
+            self._nested(RuntimeError("boom"))
+        self.assertEqual(self.clients[0].closed, 1)
+        self.assertIsNone(self.state.client)
+
+
+class FollowTailTests(unittest.TestCase):
+    def test_prefetches_before_render_and_paces_empty_batches(self) -> None:
+        log = []
+        batches = [
+            {"events": ["a"], "next_cursor": "c1"},
+            {"events": [], "next_cursor": None},
+            {"events": ["b"], "next_cursor": "c2"},
+        ]
+
+        class Stop(Exception):
+            pass
+
+        class Client:
+            async def call(self, command, params):
+                log.append(("call", command, params.get("since")))
+                if not batches:
+                    raise Stop()
+                return batches.pop(0)
+
+        async def pace(interval, empty_polls, elapsed, long_poll):
+            log.append(("pace", empty_polls))
+
+        def render(result, label):
+            log.append(("render", label, tuple(result["events"])))
+
+        query = {"limit": 10}
+        with mock.patch.object(cli, "_print_result", render), \
+                mock.patch.object(cli, "_pace_empty_poll", pace):
+            with self.assertRaises(Stop):
+                cli._run_coroutine(
+                    cli._follow_tail(Client(), "dataspace_events", "dataspace:events", query, "c0", True, 0.5)
+                )
+
+        self.assertEqual(
+            log,
+            [
+                ("call", "dataspace_events", "c0"),
+                ("call", "dataspace_events", "c1"),
+                ("render", "dataspace:events", ("a",)),
+                ("render", "dataspace:events", ()),
+                ("pace", 1),
+                ("call", "dataspace_events", "c1"),
+                ("call", "dataspace_events", "c2"),
+                ("render", "dataspace:events", ("b",)),
+            ],
+        )
+        self.assertEqual(query, {"limit": 10, "since": "c2"})
+
+
+class HistoryPagingTests(unittest.TestCase):
+    def test_long_history_is_paged_into_one_table(self) -> None:
+        calls = []
+
+        class Client(_FakeClient):
+            async def call(self, command, params):
+                calls.append((command, params["start"], params["limit"]))
+                turns = [{"turn_id": f"turn-{i:03d}", "clock": i} for i in range(params["start"], 450)]
+                return {"turns": turns[: params["limit"]]}
+
+        state = CLIState(root=None, codebased_bin=None, daemon_host=None, daemon_port=None)
+        state.client = Client(("127.0.0.1", 4000))
+        with mock.patch.object(cli, "_PLAIN_OUTPUT", False), cli.console.capture() as capture:
+            cli._run_coroutine(cli._run_history(state, {"branch": "main", "start": 0, "limit": 450}))
+
+        self.assertEqual(calls, [("history", 0, 200), ("history", 200, 200), ("history", 400, 50)])
+        output = capture.get()
+        self.assertEqual(output.count("Turn History"), 1)
+        self.assertEqual(output.count("turn-"), 450)
+        self.assertIn("turn-449", output)
+
+
+class ResumePromptTests(unittest.TestCase):
+    def test_keeps_newest_entries_within_budget_in_order(self) -> None:
+        entries = [{"prompt": f"p{i}" + "x" * 6000, "response": f"r{i}"} for i in range(4)]
+
+        class Client:
+            async def call(self, command, params):
+                return {"entries": entries}
+
+        with cli.console.capture() as capture:
+            text = cli._run_coroutine(cli._augment_prompt_with_history(Client(), "next", "req-1", 10))
+
+        self.assertLessEqual(len(text), cli.RESUME_PROMPT_BUDGET)
+        expected = "\n\n".join(
+            f"{label}: {entry[key]}"
+            for entry in entries[2:]
+            for label, key in (("User", "prompt"), ("Assistant", "response"))
+        )
+        self.assertEqual(text, expected + "\n\nUser: next")
+        self.assertIn("Entries included: 2", capture.get())
+        self.assertIn("Older entries omitted", capture.get())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,7 @@ fn main() -> io::Result<()> {
     let mut root: Option<PathBuf> = None;
     let mut init_storage = true;
     let mut listen_addr: Option<String> = None;
+    let mut listen_fd: Option<i32> = None;
 
     while let Some(arg) = args.next() {
         match arg.as_str() {
@@ -50,6 +51,20 @@ fn main() -> io::Result<()> {
                 };
                 listen_addr = Some(addr);
             }
+            "--listen-fd" => {
+                let fd = match args.next().and_then(|value| value.parse::<i32>().ok()) {
+                    Some(fd) => fd,
+                    None => {
+                        eprintln!("--listen-fd requires a file descriptor number");
+                        print_usage();
+                        return Err(io::Error::new(
+                            io::ErrorKind::InvalidInput,
+                            "missing or invalid value for --listen-fd",
+                        ));
+                    }
+                };
+                listen_fd = Some(fd);
+            }
             "--help" | "-h" => {
                 print_usage();
                 return Ok(());
@@ -96,8 +111,12 @@ fn main() -> io::Result<()> {
         eprintln!("Failed to ensure harness agent: {err}");
     }
 
+    if let Some(fd) = listen_fd {
+        return run_tcp(control, inherited_listener(fd)?);
+    }
+
     if let Some(addr) = listen_addr {
-        return run_tcp(control, &addr);
+        return run_tcp(control, TcpListener::bind(addr)?);
     }
 
     run_stdio(control)
@@ -113,8 +132,7 @@ fn run_stdio(control: Control) -> io::Result<()> {
     service.handle(reader, writer)
 }
 
-fn run_tcp(control: Control, addr: &str) -> io::Result<()> {
-    let listener = TcpListener::bind(addr)?;
+fn run_tcp(control: Control, listener: TcpListener) -> io::Result<()> {
     let actual = listener.local_addr()?;
     eprintln!("codebased listening on {}", actual);
 
@@ -138,18 +156,84 @@ fn run_tcp(control: Control, addr: &str) -> io::Result<()> {
     Ok(())
 }
 
+/// Adopt a listening socket handed down by the parent process (the CLI binds it
+/// before spawning us so there is no window for another process to take the
+/// port).
+#[cfg(unix)]
+fn inherited_listener(fd: i32) -> io::Result<TcpListener> {
+    use std::os::unix::io::FromRawFd;
+
+    // SAFETY: the parent passes ownership of an open, listening TCP socket via
+    // --listen-fd and nothing else in this process refers to that descriptor.
+    let inherited = unsafe { TcpListener::from_raw_fd(fd) };
+    // The inherited descriptor arrives without FD_CLOEXEC. try_clone dups it
+    // with F_DUPFD_CLOEXEC, so agent processes we spawn do not keep the port
+    // open; dropping the original closes the inheritable copy.
+    let listener = inherited.try_clone()?;
+    drop(inherited);
+    Ok(listener)
+}
+
+#[cfg(not(unix))]
+fn inherited_listener(_fd: i32) -> io::Result<TcpListener> {
+    Err(io::Error::new(
+        io::ErrorKind::Unsupported,
+        "--listen-fd is only supported on Unix platforms",
+    ))
+}
+
 fn print_usage() {
     eprintln!(
-        "Usage: codebased [--root PATH] [--no-init] [--stdio] [--listen ADDR]\n\
+        "Usage: codebased [--root PATH] [--no-init] [--stdio] [--listen ADDR] [--listen-fd FD]\n\
          \n\
          Options:\n\
            --root PATH   Runtime root directory (default: nearest .duet folder)\n\
            --no-init     Skip storage initialization (assumes existing data)\n\
            --stdio       Communicate over stdin/stdout (default)\n\
-           --listen ADDR Listen on TCP ADDR instead of stdio\n"
+           --listen ADDR Listen on TCP ADDR instead of stdio\n\
+           --listen-fd FD Serve TCP on an inherited listening socket FD\n"
     );
 }
 
 fn to_io_error(error: duet::runtime::error::RuntimeError) -> io::Error {
     io::Error::new(io::ErrorKind::Other, error.to_string())
 }
+
+#[cfg(all(test, unix))]
+mod tests {
+    use super::*;
+    use std::io::{Read, Write};
+    use std::net::TcpStream;
+    use std::os::unix::io::{AsRawFd, IntoRawFd};
+
+    #[test]
+    fn test_inherited_listener_adopts_fd() {
+        let original = TcpListener::bind("127.0.0.1:0").unwrap();
+        let addr = original.local_addr().unwrap();
+        let listener = inherited_listener(original.into_raw_fd()).unwrap();
+        assert_eq!(listener.local_addr().unwrap(), addr);
+
+        let mut client = TcpStream::connect(addr).unwrap();
+        client.write_all(b"ping").unwrap();
+        let (mut server, _) = listener.accept().unwrap();
+        let mut buf = [0u8; 4];
+        server.read_exact(&mut buf).unwrap();
+        assert_eq!(&buf, b"ping");
+    }
+
+    #[cfg(target_os = "linux")]
+    #[test]
+    fn test_inherited_listener_is_close_on_exec() {
+        let original = TcpListener::bind("127.0.0.1:0").unwrap();
+        let listener = inherited_listener(original.into_raw_fd()).unwrap();
+        let info =
+            std::fs::read_to_string(format!("/proc/self/fdinfo/{}", listener.as_raw_fd())).unwrap();
+        let flags = info
+            .lines()
+            .find_map(|line| line.strip_prefix("flags:"))
+            .map(|value| u32::from_str_radix(value.trim(), 8).unwrap())
+            .unwrap();
+        // O_CLOEXEC as reported in fdinfo (octal 02000000).
+        assert_ne!(flags & 0o2000000, 0);
+    }
+}